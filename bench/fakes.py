@@ -0,0 +1,280 @@
+# bench/fakes.py — 벤치마크용 로컬 가짜 서비스 (RSS, OpenWeather, Discord, Gemini)
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+from xml.sax.saxutils import escape
+
+
+TITLE_WORDS = (
+    "넥슨 엔씨소프트 넷마블 크래프톤 스마일게이트 펄어비스 닌텐도 소니 밸브 유비소프트 캡콤 블리자드 "
+    "신작 실적 업데이트 서비스 종료 투자 구조조정 e스포츠 대회 글로벌 출시 베타 테스트 가격 인상 "
+    "인수 합병 신규 IP 공개 모바일 콘솔 PC 매출 이용자 흥행 논란 확률형 규제 개발자 인터뷰 로드맵"
+).split()
+
+
+def story_title(key: str) -> str:
+    """`key`마다 고정된, 서로 겹치지 않는 그럴듯한 기사 제목."""
+    rng = random.Random(key)
+    return " ".join(rng.sample(TITLE_WORDS, 6))
+
+
+def build_rss(
+    name: str, entries: int, hours_span: float = 48, atom: bool = False, shared_ratio: float = 0.0
+) -> bytes:
+    """`entries`개의 항목을 최신순으로 담은 RSS 2.0 / Atom 피드 (절반 정도가 24시간 이내).
+
+    `shared_ratio` 비율의 항목은 모든 피드가 같은 기사를 싣는다 (제목 동일, 링크는 출처별).
+    """
+    now = datetime.now(timezone.utc)
+    step = timedelta(hours=hours_span / max(entries, 1))
+    shared_every = round(1 / shared_ratio) if shared_ratio > 0 else 0
+    items = []
+    for i in range(entries):
+        published = now - step * i
+        shared = shared_every and i % shared_every == 0
+        title = escape(story_title(f"shared-{i}" if shared else f"{name}-{i}"))
+        link = escape(f"https://{name}.example.com/news/{i}?utm_source=rss")
+        summary = escape("본문 요약 " * 40)
+        if atom:
+            items.append(
+                f"<entry><title>{title}</title><link href=\"{link}\"/>"
+                f"<id>{link}</id><updated>{published.isoformat()}</updated>"
+                f"<summary>{summary}</summary></entry>"
+            )
+        else:
+            items.append(
+                f"<item><title>{title}</title><link>{link}</link>"
+                f"<pubDate>{format_datetime(published)}</pubDate>"
+                f"<description>{summary}</description></item>"
+            )
+
+    if atom:
+        body = (
+            '<?xml version="1.0" encoding="utf-8"?>'
+            '<feed xmlns="http://www.w3.org/2005/Atom">'
+            f"<title>{escape(name)}</title><updated>{now.isoformat()}</updated>"
+            f"{''.join(items)}</feed>"
+        )
+    else:
+        body = (
+            '<?xml version="1.0" encoding="utf-8"?><rss version="2.0"><channel>'
+            f"<title>{escape(name)}</title><link>https://{name}.example.com/</link>"
+            f"{''.join(items)}</channel></rss>"
+        )
+    return body.encode("utf-8")
+
+
+def build_weather() -> dict:
+    return {
+        "weather": [{"description": "맑음", "icon": "01d"}],
+        "main": {"temp": 12.3, "feels_like": 11.0, "humidity": 55},
+        "wind": {"speed": 2.1},
+    }
+
+
+def build_forecast(items: int = 40) -> dict:
+    now = int(time.time())
+    return {
+        "list": [
+            {
+                "dt": now + i * 3 * 3600,
+                "main": {"temp": 10 + (i % 8)},
+                "weather": [{"icon": "01d"}],
+                "pop": (i % 5) / 5,
+            }
+            for i in range(items)
+        ]
+    }
+
+
+def build_onecall(hours: int = 48) -> dict:
+    now = int(time.time())
+    current = build_weather()
+    return {
+        "current": {
+            "temp": current["main"]["temp"],
+            "feels_like": current["main"]["feels_like"],
+            "humidity": current["main"]["humidity"],
+            "wind_speed": current["wind"]["speed"],
+            "weather": current["weather"],
+        },
+        "hourly": [
+            {"dt": now + i * 3600, "temp": 10 + (i % 8), "weather": [{"icon": "01d"}], "pop": (i % 5) / 5}
+            for i in range(hours)
+        ],
+    }
+
+
+class FakeServices:
+    """RSS / OpenWeather / Discord 웹훅을 흉내 내는 로컬 HTTP 서버.
+
+    - `GET /rss/<name>` — `feed_entries`개 항목, `feed_latency`초 지연,
+      `feed_shared_ratio` 비율은 피드 간 같은 기사
+    - `GET /owm/weather`, `GET /owm/forecast`, `GET /owm/onecall`, `GET /owm/geo/direct`
+      — `weather_latency`초 지연
+    - `POST /discord/webhook` — `discord_latency`초 지연, `discord_429_every`번째 요청마다 429
+    """
+
+    def __init__(
+        self,
+        feed_entries: int = 50,
+        feed_latency: float = 0.1,
+        weather_latency: float = 0.1,
+        discord_latency: float = 0.05,
+        discord_429_every: int = 0,
+        discord_retry_after: float = 0.2,
+        feed_shared_ratio: float = 0.0,
+    ):
+        self.feed_entries = feed_entries
+        self.feed_latency = feed_latency
+        self.weather_latency = weather_latency
+        self.discord_latency = discord_latency
+        self.discord_429_every = discord_429_every
+        self.discord_retry_after = discord_retry_after
+        self.feed_shared_ratio = feed_shared_ratio
+        self.discord_requests = 0
+        self.discord_messages = []
+        self._lock = threading.Lock()
+        self._feeds = {}
+        self._server = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def feed_urls(self, names: list[str]) -> list[str]:
+        return [f"{self.base_url}/rss/{name}" for name in names]
+
+    def feed_body(self, name: str) -> bytes:
+        with self._lock:
+            if name not in self._feeds:
+                self._feeds[name] = build_rss(
+                    name, self.feed_entries, shared_ratio=self.feed_shared_ratio
+                )
+            return self._feeds[name]
+
+    def start(self) -> "FakeServices":
+        services = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # 헤더와 본문을 따로 쓰므로, keep-alive 연결에서 Nagle + delayed ACK로
+            # 요청마다 ~40ms가 붙지 않도록 TCP_NODELAY를 켠다
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status: int, body: bytes, content_type: str, headers=None):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                path = urlparse(self.path).path
+                if path.startswith("/rss/"):
+                    time.sleep(services.feed_latency)
+                    body = services.feed_body(path.rsplit("/", 1)[-1])
+                    self._reply(200, body, "application/rss+xml; charset=utf-8")
+                elif path == "/owm/weather":
+                    time.sleep(services.weather_latency)
+                    self._reply(200, json.dumps(build_weather()).encode(), "application/json")
+                elif path == "/owm/forecast":
+                    time.sleep(services.weather_latency)
+                    self._reply(200, json.dumps(build_forecast()).encode(), "application/json")
+                elif path == "/owm/onecall":
+                    time.sleep(services.weather_latency)
+                    self._reply(200, json.dumps(build_onecall()).encode(), "application/json")
+                elif path == "/owm/geo/direct":
+                    time.sleep(services.weather_latency)
+                    body = [{"name": "Seoul", "lat": 37.57, "lon": 126.98}]
+                    self._reply(200, json.dumps(body).encode(), "application/json")
+                else:
+                    self._reply(404, b"{}", "application/json")
+
+            def _discord(self):
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                time.sleep(services.discord_latency)
+                with services._lock:
+                    services.discord_requests += 1
+                    count = services.discord_requests
+                    throttle = services.discord_429_every and count % services.discord_429_every == 0
+                    if not throttle:
+                        services.discord_messages.append(payload)
+                headers = {
+                    "X-RateLimit-Bucket": "bench",
+                    "X-RateLimit-Limit": "5",
+                    "X-RateLimit-Remaining": "4",
+                    "X-RateLimit-Reset-After": "1.0",
+                }
+                if throttle:
+                    body = {"retry_after": services.discord_retry_after, "global": False}
+                    self._reply(429, json.dumps(body).encode(), "application/json", headers)
+                elif "wait=true" in self.path or self.command == "PATCH":
+                    self._reply(200, json.dumps({"id": str(count)}).encode(), "application/json", headers)
+                else:
+                    self._reply(204, b"", "application/json", headers)
+
+            do_POST = _discord
+            do_PATCH = _discord
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+
+class _FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class FakeGeminiModel:
+    """`generate_content`만 흉내 내는 Gemini 대역. 지연 시간과 응답 길이를 조절할 수 있다."""
+
+    def __init__(self, latency: float = 0.5, response_chars: int = 1500, chunks: int = 5):
+        self.latency = latency
+        self.response_chars = response_chars
+        self.chunks = max(1, chunks)
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _text(self, prompt: str) -> str:
+        return ("요약 내용 " * (self.response_chars // 6 + 1))[: self.response_chars]
+
+    def generate_content(self, prompt, stream: bool = False, generation_config=None, **kwargs):
+        with self._lock:
+            self.calls += 1
+        if (generation_config or {}).get("response_mime_type") == "application/json":
+            time.sleep(self.latency)
+            keys = re.findall(r"\[작업: ([\w-]+)\]", prompt)
+            return _FakeResponse(json.dumps({key: self._text(prompt) for key in keys}))
+
+        text = self._text(prompt)
+        if not stream:
+            time.sleep(self.latency)
+            return _FakeResponse(text)
+
+        def generate():
+            size = len(text) // self.chunks + 1
+            for i in range(self.chunks):
+                time.sleep(self.latency / self.chunks)
+                yield _FakeResponse(text[i * size:(i + 1) * size])
+
+        return generate()
@@ -0,0 +1,151 @@
+# bench/parse_bench.py — feedparser vs 경량 RSS/Atom 파서 비교 벤치마크
+"""
+사용법 (저장소 루트에서):
+    python -m bench.parse_bench                 # bench/fixtures/*.xml (없으면 합성 피드)로 비교
+    python -m bench.parse_bench --record        # 실제 피드(NEWS/GAMING_RSS_URLS)를 fixtures에 추가 저장
+    python -m bench.parse_bench --hours 48 --repeat 20
+
+피드별로 두 파서의 파싱 시간(중앙값, ms)과 최대 메모리(KB), 결과 엔트리 수, 경량 파서가
+실제로 쓴 경로(fast / fast+stop / feedparser 폴백)를 출력하고, 두 파서의 결과가 다르면
+종료 코드 1로 실패한다. 경량 파서 결과는 처음 보는 피드(끝까지 읽음)와 정렬을 확인한 뒤
+(조기 중단 허용) 두 번 모두 비교한다.
+
+저장소의 `bench/fixtures/synthetic-*.xml`은 실제 피드를 받은 것이 아니라, 설정된 8개
+피드의 형식(CDATA, 편집 순서로 섞인 BBC 피드, 피드 간 공유 링크, EUC-KR 인코딩,
+상대 링크, 제목 속 HTML, RSS 1.0 + dc:date)만 흉내 내 만든 합성 피드다. 제목·본문은
+의미 없는 자리 채움 텍스트이므로 실제 피드 크기·분포에서의 수치가 필요하면
+`--record`로 실제 피드(접두사 없는 이름)를 받아 함께 측정한다.
+
+수집 기간은 피드마다 가장 최신 엔트리 시각 기준으로 잡으므로, 오래된 fixture도 항상
+일부는 기간 안, 일부는 기간 밖인 상태로 비교된다.
+"""
+import argparse
+import os
+import re
+import statistics
+import sys
+import time
+import tracemalloc
+from urllib.parse import urlsplit
+
+from bench.fakes import build_rss
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def load_main():
+    """파서 함수만 쓰므로 필수 환경변수는 더미 값으로 채운 뒤 main을 import한다."""
+    for name in ("OPENWEATHER_API_KEY", "GEMINI_API_KEY"):
+        os.environ.setdefault(name, "bench")
+    os.environ.setdefault("DISCORD_WEBHOOK_URL", "http://127.0.0.1:9/discord")
+    import main
+
+    return main
+
+
+def fixture_name(url: str) -> str:
+    """피드 URL → fixture 파일 이름 (호스트 + 경로, 예: feeds.bbci.co.uk_news_business_rss.xml)."""
+    parts = urlsplit(url)
+    name = re.sub(r"[^\w.-]+", "_", parts.netloc + parts.path).strip("_")
+    return name if name.endswith(".xml") else f"{name}.xml"
+
+
+def record_fixtures(main, directory: str) -> None:
+    os.makedirs(directory, exist_ok=True)
+    for url in main.NEWS_RSS_URLS + main.GAMING_RSS_URLS:
+        r = main.get_http_session().get(url, timeout=20)
+        r.raise_for_status()
+        path = os.path.join(directory, fixture_name(url))
+        with open(path, "wb") as f:
+            f.write(r.content)
+        print(f"recorded {url} → {path} ({len(r.content)} bytes)")
+
+
+def load_fixtures(directory: str) -> dict[str, bytes]:
+    """저장된 피드가 있으면 그것을, 없으면 크기가 다른 합성 피드를 쓴다."""
+    if os.path.isdir(directory):
+        fixtures = {}
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(".xml"):
+                with open(os.path.join(directory, name), "rb") as f:
+                    fixtures[name] = f.read()
+        if fixtures:
+            return fixtures
+
+    print("no recorded fixtures; using synthetic feeds", file=sys.stderr)
+    return {
+        "synthetic-rss-50.xml": build_rss("small", 50),
+        "synthetic-rss-500.xml": build_rss("large", 500, hours_span=240),
+        "synthetic-atom-200.xml": build_rss("atom", 200, hours_span=120, atom=True),
+    }
+
+
+def measure(fn, repeat: int) -> tuple[float, float]:
+    """(중앙값 ms, 최대 메모리 KB). 메모리는 시간 측정과 분리해 한 번만 잰다."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak / 1024
+
+
+def main_cli(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="RSS parser benchmark")
+    parser.add_argument("--fixtures", default=FIXTURES_DIR)
+    parser.add_argument("--record", action="store_true", help="실제 피드를 받아 fixtures로 저장")
+    parser.add_argument("--hours", type=float, default=24, help="수집 기간 (시간)")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    main = load_main()
+    if args.record:
+        record_fixtures(main, args.fixtures)
+
+    mismatches = []
+
+    fixtures = load_fixtures(args.fixtures)
+    print(f"{'fixture':<60}{'KB':>8}{'feedparser':>12}{'fast':>10}{'speedup':>9}"
+          f"{'mem fp':>10}{'mem fast':>10}{'entries':>9}  path")
+    for name, body in fixtures.items():
+        url = f"https://bench.example.com/{name}"
+
+        def run(fast: bool, since=None):
+            main.FEED_FAST_PARSE = fast
+            return main.parse_feed_entries(url, body, {}, since)
+
+        newest = max((e.published for e in run(False)), default=main.datetime.now(main.TZ))
+        since = newest - main.timedelta(hours=args.hours)
+
+        expected = [str(e) for e in run(False, since)]
+        main._feed_order.pop(url, None)
+        main._fast_parse_fallbacks.pop(url, None)
+        first = [str(e) for e in run(True, since)]  # 처음 보는 피드: 끝까지 읽음
+        ordered = main._feed_order.get(url, (False, 0))[0]
+        second = [str(e) for e in run(True, since)]  # 최신순이면 조기 중단
+        if expected != first or expected != second:
+            mismatches.append(name)
+
+        if url in main._fast_parse_fallbacks:
+            path = "feedparser"
+        else:
+            path = "fast+stop" if ordered else "fast"
+        slow_ms, slow_kb = measure(lambda: run(False, since), args.repeat)
+        fast_ms, fast_kb = measure(lambda: run(True, since), args.repeat)
+
+        print(f"{name[:59]:<60}{len(body) / 1024:>8.0f}{slow_ms:>10.1f}ms{fast_ms:>8.1f}ms"
+              f"{slow_ms / max(fast_ms, 1e-6):>8.1f}x{slow_kb:>10.0f}{fast_kb:>10.0f}"
+              f"{len(expected):>9}  {path}")
+
+    for name in mismatches:
+        print(f"MISMATCH {name}: fast parser output differs from feedparser", file=sys.stderr)
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
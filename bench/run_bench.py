@@ -0,0 +1,219 @@
+# bench/run_bench.py — handler() 종단 간 벤치마크 (외부 서비스 없이 로컬 가짜 서비스로 측정)
+"""
+사용법 (저장소 루트에서):
+    python -m bench.run_bench                     # 측정 후 bench/baseline.json과 비교
+    python -m bench.run_bench --update-baseline   # 현재 측정값으로 baseline 갱신
+    python -m bench.run_bench --gemini-latency 1.5 --feed-entries 200 --discord-429-every 3
+
+섹션(그래프 노드)별, 전체 실행별 p50/p95(ms)를 출력하고, baseline의 p95보다
+`--tolerance` 비율 + `--slack-ms` 이상 느려진 단계가 있으면 종료 코드 1로 실패한다.
+baseline과 측정 설정(시나리오 옵션)이 다르면 비교하지 않고 종료 코드 2로 끝난다.
+"""
+import argparse
+import json
+import logging
+import math
+import os
+import sys
+import time
+
+from bench.fakes import FakeGeminiModel, FakeServices
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+NEWS_FEEDS = ["bbc-business", "bbc-science", "bbc-tech"]
+GAMING_FEEDS = ["inven", "gamedeveloper", "gamedonga", "gametoc", "ruliweb"]
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """nearest-rank 방식 백분위수."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def load_app(
+    services: FakeServices, gemini: FakeGeminiModel, destinations: int = 1, cities: int = 1,
+    onecall: bool = False,
+):
+    """가짜 서비스를 바라보도록 환경변수를 맞춘 뒤 main을 import하고 Gemini 대역을 주입한다.
+
+    `destinations`가 2 이상이면 웹훅 경로가 다른 구독을 만들어 팬아웃을 측정한다
+    (도시는 `cities`개를 돌아가며 배정). `onecall`이면 날씨를 통합 엔드포인트 1회로 받는다.
+    """
+    if destinations > 1:
+        os.environ["SUBSCRIPTIONS"] = json.dumps([
+            {
+                "name": f"dest{i + 1}",
+                "webhook": f"{services.base_url}/discord/webhook/{i + 1}",
+                "city": f"City{i % cities + 1}",
+            }
+            for i in range(destinations)
+        ])
+    else:
+        os.environ.pop("SUBSCRIPTIONS", None)
+    os.environ.update(
+        OPENWEATHER_API_KEY="bench",
+        GEMINI_API_KEY="bench",
+        DISCORD_WEBHOOK_URL=f"{services.base_url}/discord/webhook",
+        OPENWEATHER_BASE_URL=f"{services.base_url}/owm",
+        OPENWEATHER_GEO_URL=f"{services.base_url}/owm/geo",
+    )
+    if onecall:
+        os.environ["OPENWEATHER_ONECALL_URL"] = f"{services.base_url}/owm/onecall"
+    else:
+        os.environ.pop("OPENWEATHER_ONECALL_URL", None)
+    for name in ("AUTH_TOKEN", "RUN_STATE_PATH", "GEMINI_CACHE_PATH", "FEED_STORE_PATH"):
+        os.environ.pop(name, None)
+
+    import main
+
+    main._model = gemini
+    main.NEWS_RSS_URLS = services.feed_urls(NEWS_FEEDS)
+    main.GAMING_RSS_URLS = services.feed_urls(GAMING_FEEDS)
+    return main
+
+
+def run_once(main, stream: bool, warm: bool) -> tuple[dict[str, float], list[str]]:
+    """브리핑 1회 실행. {단계: ms}와 errors를 반환한다 (`warm`이면 Gemini/피드/날씨 캐시 유지)."""
+    if not warm:
+        main.gemini_cache = main.GeminiCache(main.GEMINI_CACHE_MAX_ENTRIES)
+        main._feed_cache.clear()
+        main.weather_provider.clear()
+
+    query = "/?force=all" + ("&stream=true" if stream else "")
+    with main.app.test_client() as client:
+        started = time.perf_counter()
+        response = client.get(query)
+        total_ms = (time.perf_counter() - started) * 1000
+
+    body = response.get_json()
+    run = main.get_run(body["run_id"]).to_dict()
+    timings = {
+        name: info["duration_ms"]
+        for name, info in run["sections"].items()
+        if "duration_ms" in info
+    }
+    timings["total"] = total_ms
+    return timings, body.get("errors", [])
+
+
+def summarise(samples: list[dict[str, float]]) -> dict[str, dict[str, float]]:
+    stages = sorted({stage for sample in samples for stage in sample})
+    result = {}
+    for stage in stages:
+        values = [sample[stage] for sample in samples if stage in sample]
+        result[stage] = {
+            "p50": round(percentile(values, 50), 1),
+            "p95": round(percentile(values, 95), 1),
+        }
+    return result
+
+
+def compare(current: dict, baseline: dict, tolerance: float, slack_ms: float) -> list[str]:
+    """baseline p95 대비 허용 범위를 넘은 단계 목록."""
+    regressions = []
+    for stage, base in baseline.get("stages", {}).items():
+        if stage not in current:
+            continue
+        limit = base["p95"] * (1 + tolerance) + slack_ms
+        if current[stage]["p95"] > limit:
+            regressions.append(
+                f"{stage}: p95 {current[stage]['p95']:.1f}ms > {limit:.1f}ms "
+                f"(baseline {base['p95']:.1f}ms)"
+            )
+    return regressions
+
+
+def main_cli(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="AI Secretary end-to-end benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--feed-entries", type=int, default=50)
+    parser.add_argument("--feed-latency", type=float, default=0.1)
+    parser.add_argument("--feed-shared-ratio", type=float, default=0.0,
+                        help="피드 간 같은 기사 비율 (중복 합치기 측정용)")
+    parser.add_argument("--weather-latency", type=float, default=0.1)
+    parser.add_argument("--gemini-latency", type=float, default=0.5)
+    parser.add_argument("--discord-latency", type=float, default=0.05)
+    parser.add_argument("--discord-429-every", type=int, default=0,
+                        help="N번째 Discord 요청마다 429 응답 (0이면 끔)")
+    parser.add_argument("--destinations", type=int, default=1, help="구독(웹훅) 수")
+    parser.add_argument("--cities", type=int, default=1, help="구독들에 배정할 날씨 도시 수")
+    parser.add_argument("--onecall", action="store_true", help="날씨를 통합 엔드포인트로 조회")
+    parser.add_argument("--stream", action="store_true", help="스트리밍 모드로 실행")
+    parser.add_argument("--warm", action="store_true", help="실행 간 Gemini/피드/날씨 캐시 유지")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="허용 p95 증가 비율")
+    parser.add_argument("--slack-ms", type=float, default=50.0, help="허용 p95 절대 증가량(ms)")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    services = FakeServices(
+        feed_entries=args.feed_entries,
+        feed_latency=args.feed_latency,
+        feed_shared_ratio=args.feed_shared_ratio,
+        weather_latency=args.weather_latency,
+        discord_latency=args.discord_latency,
+        discord_429_every=args.discord_429_every,
+    ).start()
+    gemini = FakeGeminiModel(latency=args.gemini_latency)
+
+    try:
+        main = load_app(services, gemini, args.destinations, args.cities, args.onecall)
+        if not args.verbose:
+            logging.getLogger().setLevel(logging.WARNING)
+
+        samples = []
+        for i in range(args.runs):
+            timings, errors = run_once(main, args.stream, args.warm)
+            samples.append(timings)
+            if errors:
+                print(f"run {i + 1}: errors {errors}", file=sys.stderr)
+    finally:
+        services.stop()
+
+    current = summarise(samples)
+    config = {
+        k: v for k, v in vars(args).items()
+        if k not in ("baseline", "update_baseline", "tolerance", "slack_ms", "verbose")
+    }
+
+    print(f"{'stage':<16}{'p50(ms)':>10}{'p95(ms)':>10}")
+    for stage, stats in current.items():
+        print(f"{stage:<16}{stats['p50']:>10.1f}{stats['p95']:>10.1f}")
+    print(f"gemini calls: {gemini.calls}, discord requests: {services.discord_requests}")
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"config": config, "stages": current}, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        print(f"baseline written: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("no baseline found; run with --update-baseline first", file=sys.stderr)
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    base_config = baseline.get("config") or {}
+    if base_config != config:
+        # 다른 시나리오의 수치끼리 비교하면 거짓 REGRESSION이 나오므로 비교하지 않는다
+        diff = ", ".join(
+            f"{key}: baseline={base_config.get(key)!r} current={config.get(key)!r}"
+            for key in sorted(set(base_config) | set(config))
+            if base_config.get(key) != config.get(key)
+        )
+        print(f"CONFIG MISMATCH ({diff}); rerun with the baseline's options "
+              "or --update-baseline", file=sys.stderr)
+        return 2
+
+    regressions = compare(current, baseline, args.tolerance, args.slack_ms)
+    for line in regressions:
+        print(f"REGRESSION {line}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
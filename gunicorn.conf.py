@@ -0,0 +1,27 @@
+# gunicorn.conf.py — 프로덕션 실행 설정 (Cloud Run)
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8080')}"
+
+# 캐시·메트릭 등 메모리 기반 상태는 워커 프로세스별로 따로 존재한다.
+# 워커를 2개 이상 쓰려면 RUN_STATE_PATH를 설정해 실행 임대·섹션 완료 상태와
+# 실행 기록(/runs)을 공유할 것 (미설정 시 /runs는 실행한 워커에서만 조회된다).
+workers = int(os.environ.get("WEB_CONCURRENCY", "1"))
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", "8"))
+
+# 요청 제한 시간은 Cloud Run이 관리하므로 워커 타임아웃은 끈다
+timeout = 0
+graceful_timeout = 30
+
+# 마스터에서 앱을 미리 import해 두면 워커 fork가 빨라진다 (스케일 아웃 시 준비 시간 단축)
+preload_app = os.environ.get("GUNICORN_PRELOAD", "true").lower() == "true"
+
+accesslog = "-"
+
+
+def post_worker_init(worker):
+    """워커가 뜬 뒤 클라이언트 예열·피드 수집기 시작 (gRPC와 스레드는 fork 이후에 만든다)."""
+    import main
+
+    main.start_background_tasks()
@@ -1,13 +1,33 @@
 # main.py
+import time
+
+_STARTUP_BEGAN = time.perf_counter()  # 콜드 스타트 측정 기준점
+
 import os
 import sys
 import logging
+import threading
+import json
+import sqlite3
+import uuid
+import contextvars
+import functools
+import socket
 import hashlib
+import math
+import random
+import re
+import xml.etree.ElementTree as ET
 import requests
 import feedparser
 import pytz
-import google.generativeai as genai
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from flask import Flask, jsonify, request
 
 # ─── 로깅 설정 ─────────────────────────────────────────────────────────
@@ -25,7 +45,51 @@ OPENWEATHER_API_KEY = os.getenv("OPENWEATHER_API_KEY")
 GEMINI_API_KEY      = os.getenv("GEMINI_API_KEY")
 CITY                = os.getenv("CITY_NAME", "Seoul,KR")
 DISCORD_WEBHOOK     = os.getenv("DISCORD_WEBHOOK_URL")
+OPENWEATHER_BASE_URL = os.getenv("OPENWEATHER_BASE_URL", "https://api.openweathermap.org/data/2.5")
+OPENWEATHER_ONECALL_URL = os.getenv("OPENWEATHER_ONECALL_URL")  # 선택: 현재+예보 통합 엔드포인트 (One Call)
+OPENWEATHER_GEO_URL = os.getenv("OPENWEATHER_GEO_URL", "https://api.openweathermap.org/geo/1.0")
+WEATHER_CACHE_TTL   = float(os.getenv("WEATHER_CACHE_TTL", "600"))  # 도시별 날씨 데이터 캐시 시간(초), 0이면 끔
 AUTH_TOKEN           = os.getenv("AUTH_TOKEN")  # 선택: 중복/무단 호출 방지용
+STARTUP_BUDGET_MS   = float(os.getenv("STARTUP_BUDGET_MS", "1500"))  # 콜드 스타트 시간 예산
+PRELOAD_CLIENTS     = os.getenv("PRELOAD_CLIENTS", "false").lower() == "true"  # 시작 직후 클라이언트 예열
+SECTION_WORKERS     = int(os.getenv("SECTION_WORKERS", "6"))  # 섹션 병렬 실행 스레드 수
+RSS_FEED_TIMEOUT    = float(os.getenv("RSS_FEED_TIMEOUT", "8"))    # 피드 1개당 최대 시간(초)
+RSS_TOTAL_TIMEOUT   = float(os.getenv("RSS_TOTAL_TIMEOUT", "20"))  # 피드 묶음 전체 최대 시간(초)
+GEMINI_CACHE_PATH   = os.getenv("GEMINI_CACHE_PATH")  # 선택: Gemini 응답 캐시 SQLite 파일
+GEMINI_CACHE_MAX_ENTRIES = int(os.getenv("GEMINI_CACHE_MAX_ENTRIES", "256"))
+GEMINI_BATCH_MODE   = os.getenv("GEMINI_BATCH_MODE", "false").lower() == "true"  # 관련 섹션 묶음 호출
+DISCORD_SEND_BUDGET = float(os.getenv("DISCORD_SEND_BUDGET", "30"))  # 전송 재시도 포함 최대 시간(초)
+ASYNC_RUNS          = os.getenv("ASYNC_RUNS", "false").lower() == "true"  # 기본 실행을 비동기(202)로
+RUN_HISTORY_LIMIT   = int(os.getenv("RUN_HISTORY_LIMIT", "50"))  # /runs 조회용으로 보관할 실행 수
+RUN_STATE_PATH      = os.getenv("RUN_STATE_PATH")  # 선택: 인스턴스 간 공유할 실행 상태 SQLite 파일
+RUN_LEASE_TTL       = int(os.getenv("RUN_LEASE_TTL", "900"))  # 실행 임대(lease) 유효 시간(초)
+FEED_STORE_PATH     = os.getenv("FEED_STORE_PATH")  # 선택: 피드 엔트리 누적 저장 SQLite 파일
+FEED_INGEST_INTERVAL = int(os.getenv("FEED_INGEST_INTERVAL", "0"))  # 백그라운드 수집 주기(초), 0이면 끔
+FEED_STORE_RETENTION_DAYS = int(os.getenv("FEED_STORE_RETENTION_DAYS", "7"))
+FEED_SINCE_LAST_BRIEFING = os.getenv("FEED_SINCE_LAST_BRIEFING", "false").lower() == "true"
+FEED_FAST_PARSE     = os.getenv("FEED_FAST_PARSE", "true").lower() == "true"  # RSS/Atom 경량 파서 우선 사용
+FEED_DEDUP          = os.getenv("FEED_DEDUP", "true").lower() == "true"  # 피드 간 중복 기사 합치기
+FEED_DEDUP_THRESHOLD = float(os.getenv("FEED_DEDUP_THRESHOLD", "0.7"))  # 제목 유사도(Jaccard) 기준
+PROMPT_TOKEN_BUDGET = int(os.getenv("PROMPT_TOKEN_BUDGET", "4000"))  # 섹션별 뉴스 목록 입력 토큰 예산
+FEED_SOURCE_WEIGHTS = os.getenv("FEED_SOURCE_WEIGHTS", "")  # 예: "bbci.co.uk=1.5,inven.co.kr=1.2"
+SUMMARY_STRATEGY    = os.getenv("SUMMARY_STRATEGY", "auto").lower()  # auto | single | map_reduce
+MAP_REDUCE_THRESHOLD = int(os.getenv("MAP_REDUCE_THRESHOLD", "150"))  # auto일 때 묶음 요약으로 바꾸는 엔트리 수
+MAP_CHUNK_SIZE      = int(os.getenv("MAP_CHUNK_SIZE", "40"))  # 묶음 1개당 최대 엔트리 수
+MAP_WORKERS         = int(os.getenv("MAP_WORKERS", "4"))  # 묶음 요약 동시 호출 수
+GEMINI_STREAM       = os.getenv("GEMINI_STREAM", "false").lower() == "true"  # 스트리밍 + 점진적 메시지 수정
+STREAM_EDIT_INTERVAL = float(os.getenv("STREAM_EDIT_INTERVAL", "1.5"))  # 메시지 수정 최소 간격(초)
+RUN_DEADLINE        = float(os.getenv("RUN_DEADLINE", "240"))  # 실행 1회의 수집/생성 외부 호출 마감(초)
+OUTBOUND_RETRIES    = int(os.getenv("OUTBOUND_RETRIES", "2"))  # 외부 호출 실패 시 재시도 횟수
+HEDGE_AFTER         = float(os.getenv("HEDGE_AFTER", "0"))  # GET 요청이 이 시간(초)보다 늦으면 중복 요청, 0이면 끔
+BREAKER_FAILURES    = int(os.getenv("BREAKER_FAILURES", "3"))  # 연속 실패 시 서킷 열림
+BREAKER_COOLDOWN    = float(os.getenv("BREAKER_COOLDOWN", "300"))  # 서킷이 열려 있는 시간(초)
+GEMINI_TIMEOUT      = float(os.getenv("GEMINI_TIMEOUT", "60"))  # Gemini 호출 1회 제한 시간(초)
+SUBSCRIPTIONS_JSON  = os.getenv("SUBSCRIPTIONS")  # 선택: 웹훅 × 섹션 × 도시 구독 목록 (JSON)
+SUBSCRIPTIONS_PATH  = os.getenv("SUBSCRIPTIONS_PATH")  # 선택: 위 JSON을 담은 파일 경로
+PRECOMPUTE_PATH     = os.getenv("PRECOMPUTE_PATH")  # 선택: 미리 생성한 embed를 보관할 SQLite 파일
+PRECOMPUTE_TTL      = float(os.getenv("PRECOMPUTE_TTL", str(36 * 3600)))  # 미리 생성한 embed 유효 시간(초)
+ARCHIVE_PATH        = os.getenv("ARCHIVE_PATH")  # 선택: 날짜별 엔트리·요약 보관 SQLite 파일 (기간 리포트용)
+ARCHIVE_RETENTION_DAYS = int(os.getenv("ARCHIVE_RETENTION_DAYS", "400"))
 
 NEWS_RSS_URLS = [
     "https://feeds.bbci.co.uk/news/business/rss.xml",
@@ -44,20 +108,43 @@ GAMING_RSS_URLS = [
 TZ = pytz.timezone("Asia/Seoul")
 
 # ─── 필수 환경변수 검증 ─────────────────────────────────────────────────
-REQUIRED_ENVS = ["OPENWEATHER_API_KEY", "GEMINI_API_KEY", "DISCORD_WEBHOOK_URL"]
+REQUIRED_ENVS = ["OPENWEATHER_API_KEY", "GEMINI_API_KEY"]
+if not (SUBSCRIPTIONS_JSON or SUBSCRIPTIONS_PATH):
+    REQUIRED_ENVS.append("DISCORD_WEBHOOK_URL")  # 구독 목록이 없으면 단일 웹훅 필수
 _missing = [e for e in REQUIRED_ENVS if not os.getenv(e)]
 if _missing:
     logger.critical("Missing required environment variables: %s", ", ".join(_missing))
     sys.exit(1)
 
 # ─── Gemini 초기화 ──────────────────────────────────────────────────────
-genai.configure(api_key=GEMINI_API_KEY)
-model = genai.GenerativeModel("gemini-2.5-flash")
-
-# ─── 중복 실행 방지용 (메모리 기반, 컨테이너 수명 동안 유지) ──────────────
-_last_run_date = None
+GEMINI_MODEL_NAME = "gemini-2.5-flash"
+
+# google.generativeai는 import만 수백 ms가 걸리므로 첫 호출 시점에 초기화한다 (get_model)
+_model = None
+_model_lock = threading.Lock()
+
+# 호출 지점별 Gemini 응답 캐시 TTL (초). 프롬프트가 같을 때만 재사용된다.
+GEMINI_CACHE_TTLS = {
+    "greeting": 24 * 3600,
+    "today_info": 24 * 3600,
+    "news": 6 * 3600,
+    "gaming_news": 6 * 3600,
+    "gaming_trends": 6 * 3600,
+    "news_chunk": 6 * 3600,
+    "digest": 6 * 3600,
+}
+
+# 섹션별 뉴스 목록 토큰 예산 (PROMPT_TOKEN_BUDGET_<SECTION>으로 개별 지정 가능)
+PROMPT_TOKEN_BUDGETS = {
+    section: int(os.getenv(f"PROMPT_TOKEN_BUDGET_{section.upper()}", PROMPT_TOKEN_BUDGET))
+    for section in ("news", "gaming_news", "gaming_trends")
+}
 
 DISCORD_EMBED_DESC_LIMIT = 4000  # Discord embed description 안전 한계
+DISCORD_MAX_EMBEDS = 10           # 웹훅 메시지 1개당 embed 최대 개수
+DISCORD_MESSAGE_CHAR_LIMIT = 6000 # 메시지 1개의 embed 전체 글자 수 한계
+
+HTTP_USER_AGENT = "Mozilla/5.0 (compatible; AI-Secretary/1.0)"
 
 
 # ═════════════════════════════════════════════════════════════════════════
@@ -71,6 +158,24 @@ def truncate_for_discord(text: str, limit: int = DISCORD_EMBED_DESC_LIMIT) -> st
     return text[:limit] + "\n\n… *(글자 수 제한으로 일부 생략됨)*"
 
 
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """커넥션 풀을 공유하는 requests 세션 (스레드 간 재사용)."""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers["User-Agent"] = HTTP_USER_AGENT
+            _http_session = session
+        return _http_session
+
+
 def parse_entry_date(entry) -> datetime | None:
     """RSS 엔트리에서 날짜를 파싱한다. 실패하면 None 반환."""
     for attr in ("published_parsed", "updated_parsed"):
@@ -83,71 +188,793 @@ def parse_entry_date(entry) -> datetime | None:
     return None
 
 
-def safe_gemini(prompt: str, fallback: str = "AI 요약 생성 중 오류가 발생했습니다.") -> str:
-    """Gemini API 호출을 안전하게 수행."""
+def get_model():
+    """Gemini 모델 클라이언트 (첫 사용 시 import + 초기화)."""
+    global _model
+    with _model_lock:
+        if _model is None:
+            started = time.perf_counter()
+            import google.generativeai as genai
+
+            genai.configure(api_key=GEMINI_API_KEY)
+            _model = genai.GenerativeModel(GEMINI_MODEL_NAME)
+            logger.info("Gemini client initialised in %.0f ms",
+                        (time.perf_counter() - started) * 1000)
+        return _model
+
+
+def warm_up_clients() -> None:
+    """무거운 클라이언트를 미리 초기화한다 (요청 경로 밖에서 호출)."""
+    try:
+        get_model()
+        get_http_session()
+    except Exception as e:
+        logger.warning("Client warm-up failed: %s", e)
+
+
+def open_sqlite(path: str, journal_mode: str = "WAL") -> sqlite3.Connection:
+    """스레드 간에 공유하는 SQLite 연결 (호출 측에서 Lock으로 직렬화).
+
+    WAL은 공유 메모리 인덱스를 쓰므로 같은 호스트의 프로세스끼리만 안전하다.
+    여러 호스트가 같은 파일을 여는 경우에는 `journal_mode="DELETE"`를 쓴다.
+    """
+    conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+    conn.execute(f"PRAGMA journal_mode={journal_mode}")
+    return conn
+
+
+class LazySqlite:
+    """첫 사용 시에 여는 SQLite 연결.
+
+    import 시점 비용을 줄이고, pre-fork 서버(gunicorn preload)에서 연결이
+    fork 이후 워커 프로세스 안에서 열리도록 한다.
+    """
+
+    def __init__(self, path: str, schema: str, journal_mode: str = "WAL"):
+        self.path = path
+        self._schema = schema
+        self._journal_mode = journal_mode
+        self._conn = None
+        self._lock = threading.Lock()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._conn is None:
+                conn = open_sqlite(self.path, self._journal_mode)
+                conn.executescript(self._schema)
+                self._conn = conn
+            return self._conn
+
+
+class GeminiCache:
+    """모델 이름 + 프롬프트 해시로 키를 잡는 Gemini 응답 캐시.
+
+    메모리 LRU(최대 `max_entries`)를 기본으로 하고, `path`가 주어지면 SQLite에도
+    기록해 컨테이너 재시작 후에도 재사용한다. 항목마다 만료 시각을 가진다.
+    """
+
+    def __init__(self, max_entries: int = 256, path: str | None = None):
+        self.max_entries = max(1, max_entries)
+        self._mem = OrderedDict()  # key -> (expires_at, text)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._db = None
+        if path:
+            self._db = LazySqlite(
+                path,
+                "CREATE TABLE IF NOT EXISTS gemini_cache ("
+                " key TEXT PRIMARY KEY, text TEXT NOT NULL,"
+                " expires_at REAL NOT NULL, accessed_at REAL NOT NULL);"
+                "CREATE INDEX IF NOT EXISTS idx_gemini_cache_accessed"
+                " ON gemini_cache (accessed_at);",
+            )
+
+    @staticmethod
+    def make_key(model_name: str, prompt: str) -> str:
+        return hashlib.sha256(f"{model_name}\0{prompt}".encode("utf-8")).hexdigest()
+
+    def get(self, model_name: str, prompt: str) -> str | None:
+        key = self.make_key(model_name, prompt)
+        now = time.time()
+        with self._lock:
+            item = self._mem.get(key)
+            if item and item[0] > now:
+                self._mem.move_to_end(key)
+                self.hits += 1
+                return item[1]
+            if item:
+                del self._mem[key]
+
+            if self._db is not None:
+                row = self._db.conn.execute(
+                    "SELECT text, expires_at FROM gemini_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row and row[1] > now:
+                    self._db.conn.execute(
+                        "UPDATE gemini_cache SET accessed_at = ? WHERE key = ?", (now, key)
+                    )
+                    self._db.conn.commit()
+                    self._remember(key, row[1], row[0])
+                    self.hits += 1
+                    return row[0]
+
+            self.misses += 1
+            return None
+
+    def put(self, model_name: str, prompt: str, text: str, ttl: float) -> None:
+        key = self.make_key(model_name, prompt)
+        now = time.time()
+        with self._lock:
+            self._remember(key, now + ttl, text)
+            if self._db is not None:
+                self._db.conn.execute(
+                    "INSERT OR REPLACE INTO gemini_cache (key, text, expires_at, accessed_at)"
+                    " VALUES (?, ?, ?, ?)",
+                    (key, text, now + ttl, now),
+                )
+                self._db.conn.execute(
+                    "DELETE FROM gemini_cache WHERE expires_at <= ? OR key IN ("
+                    " SELECT key FROM gemini_cache ORDER BY accessed_at DESC"
+                    " LIMIT -1 OFFSET ?)",
+                    (now, self.max_entries),
+                )
+                self._db.conn.commit()
+
+    def _remember(self, key: str, expires_at: float, text: str) -> None:
+        self._mem[key] = (expires_at, text)
+        self._mem.move_to_end(key)
+        while len(self._mem) > self.max_entries:
+            self._mem.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._mem),
+            }
+
+
+gemini_cache = GeminiCache(GEMINI_CACHE_MAX_ENTRIES, GEMINI_CACHE_PATH)
+
+
+def gemini_generate(
+    prompt: str,
+    ttl: float = 0,
+    generation_config: dict | None = None,
+    validate=None,
+) -> str:
+    """캐시를 거쳐 Gemini를 호출한다. 실패하면 예외를 그대로 던진다.
+
+    `validate`가 주어지면 응답 텍스트를 검사하고(실패 시 예외), 통과한 응답만 캐시한다.
+    """
+    if ttl > 0:
+        cached = gemini_cache.get(GEMINI_MODEL_NAME, prompt)
+        if cached is not None:
+            return cached
+
+    kwargs = {"generation_config": generation_config} if generation_config else {}
+
+    def attempt(timeout: float) -> str:
+        with trace_span("gemini", GEMINI_MODEL_NAME, prompt_chars=len(prompt)) as span:
+            text = get_model().generate_content(
+                prompt, request_options={"timeout": timeout}, **kwargs
+            ).text
+            span["response_chars"] = len(text)
+        return text
+
+    text = call_outbound("gemini", attempt, timeout=GEMINI_TIMEOUT)
+    if validate is not None:
+        validate(text)
+
+    if ttl > 0 and text:
+        gemini_cache.put(GEMINI_MODEL_NAME, prompt, text, ttl)
+    return text
+
+
+def gemini_stream(prompt: str, on_text, ttl: float = 0) -> str:
+    """스트리밍 생성. 조각이 도착할 때마다 지금까지의 전체 텍스트로 `on_text`를 호출한다."""
+    if ttl > 0:
+        cached = gemini_cache.get(GEMINI_MODEL_NAME, prompt)
+        if cached is not None:
+            on_text(cached)
+            return cached
+
+    def attempt(timeout: float) -> str:
+        text = ""
+        with trace_span("gemini", GEMINI_MODEL_NAME, prompt_chars=len(prompt), stream=True) as span:
+            started = time.perf_counter()
+            stream = get_model().generate_content(
+                prompt, stream=True, request_options={"timeout": timeout}
+            )
+            for chunk in stream:
+                try:
+                    piece = chunk.text
+                except ValueError:
+                    continue  # 텍스트 파트가 없는 조각 (finish_reason 등)
+                if piece:
+                    if not text:
+                        span["first_chunk_ms"] = round((time.perf_counter() - started) * 1000, 1)
+                    text += piece
+                    on_text(text)
+            span["response_chars"] = len(text)
+        return text
+
+    # 이미 일부를 내보낸 스트림은 다시 시작할 수 없으므로 재시도하지 않는다
+    text = call_outbound("gemini", attempt, timeout=GEMINI_TIMEOUT, retries=0)
+
+    if ttl > 0 and text:
+        gemini_cache.put(GEMINI_MODEL_NAME, prompt, text, ttl)
+    return text
+
+
+def safe_gemini(
+    prompt: str,
+    fallback: str = "AI 요약 생성 중 오류가 발생했습니다.",
+    ttl: float = 0,
+    on_text=None,
+) -> str:
+    """Gemini API 호출을 안전하게 수행.
+
+    `ttl`(초)이 주어지면 같은 프롬프트의 응답을 캐시에서 재사용한다.
+    실패 시 반환하는 fallback 문자열은 캐시하지 않는다.
+    `on_text`가 주어지면 스트리밍으로 생성하며 중간 텍스트를 넘겨준다.
+    """
     try:
-        res = model.generate_content(prompt)
-        return res.text
+        if on_text is not None:
+            return gemini_stream(prompt, on_text, ttl)
+        return gemini_generate(prompt, ttl)
     except Exception as e:
         logger.error("Gemini API error: %s", e)
         return fallback
 
 
+def parse_batched_response(text: str, keys: list[str]) -> dict[str, str]:
+    """묶음 호출의 JSON 응답을 {키: 텍스트}로 변환. 키가 빠졌거나 비어 있으면 ValueError."""
+    body = text.strip()
+    if body.startswith("```"):
+        body = body.strip("`")
+        body = body[body.index("\n") + 1:] if "\n" in body else body
+    data = json.loads(body)
+    if not isinstance(data, dict):
+        raise ValueError("batched response is not a JSON object")
+
+    result = {}
+    for key in keys:
+        value = data.get(key)
+        if not isinstance(value, str) or not value.strip():
+            raise ValueError(f"batched response missing section: {key}")
+        result[key] = value.strip()
+    return result
+
+
+def batched_gemini(tasks: dict[str, str], context: str = "", ttl: float = 0) -> dict[str, str] | None:
+    """여러 섹션을 한 번의 Gemini 호출로 생성한다.
+
+    `tasks`는 {섹션 키: 지시문}, `context`는 모든 작업이 공유하는 입력(뉴스 목록 등)이다.
+    응답은 JSON 구조화 출력으로 받아 파싱하며, 실패하면 None을 반환해
+    호출 측이 섹션별 개별 호출로 폴백하도록 한다.
+    """
+    keys = list(tasks)
+    sections = "\n\n".join(f"[작업: {key}]\n{instr}" for key, instr in tasks.items())
+    key_list = ", ".join(f'"{k}"' for k in keys)
+    prompt = f"""아래 {len(keys)}개의 작업을 모두 수행하고, 결과를 하나의 JSON 객체로만 답해주세요.
+JSON 키는 작업 이름({key_list})이고, 값은 해당 작업의 결과 텍스트(마크다운 문자열)입니다.
+각 작업의 형식과 글자 수 제한은 작업별 지시를 따르세요.
+
+{sections}"""
+    if context:
+        prompt += f"\n\n{context}"
+
+    try:
+        text = gemini_generate(
+            prompt,
+            ttl,
+            generation_config={"response_mime_type": "application/json"},
+            validate=lambda t: parse_batched_response(t, keys),
+        )
+        return parse_batched_response(text, keys)
+    except Exception as e:
+        logger.warning("Batched Gemini call failed (%s), falling back to per-section calls: %s",
+                       ", ".join(keys), e)
+        return None
+
+
+# ═════════════════════════════════════════════════════════════════════════
+#  트레이싱 & 메트릭 (/metrics)
+# ═════════════════════════════════════════════════════════════════════════
+
+SPAN_DURATION_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Metrics:
+    """Prometheus 텍스트 형식으로 내보내는 최소한의 카운터/히스토그램 저장소."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._meta = {}        # name -> (type, help)
+        self._counters = {}    # (name, labels) -> value
+        self._histograms = {}  # (name, labels) -> [buckets, bucket_counts, sum, count]
+
+    @staticmethod
+    def _labels(labels: dict) -> tuple:
+        return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    def inc(self, name: str, value: float = 1, help: str = "", **labels) -> None:
+        key = (name, self._labels(labels))
+        with self._lock:
+            self._meta.setdefault(name, ("counter", help))
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, buckets: tuple, help: str = "", **labels) -> None:
+        key = (name, self._labels(labels))
+        with self._lock:
+            self._meta.setdefault(name, ("histogram", help))
+            hist = self._histograms.setdefault(key, [buckets, [0] * len(buckets), 0.0, 0])
+            for i, bound in enumerate(hist[0]):
+                if value <= bound:
+                    hist[1][i] += 1
+                    break
+            hist[2] += value
+            hist[3] += 1
+
+    @staticmethod
+    def _format_labels(labels: tuple, extra: tuple = ()) -> str:
+        pairs = [f'{k}="{_escape_label(v)}"' for k, v in labels + extra]
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def render(self) -> str:
+        lines = []
+        with self._lock:
+            for name, (kind, help) in sorted(self._meta.items()):
+                if help:
+                    lines.append(f"# HELP {name} {help}")
+                lines.append(f"# TYPE {name} {kind}")
+                if kind == "counter":
+                    for (metric, labels), value in sorted(self._counters.items()):
+                        if metric == name:
+                            lines.append(f"{name}{self._format_labels(labels)} {value}")
+                    continue
+                for (metric, labels), (buckets, counts, total, count) in sorted(
+                    self._histograms.items()
+                ):
+                    if metric != name:
+                        continue
+                    cumulative = 0
+                    for bound, bucket_count in zip(buckets, counts):
+                        cumulative += bucket_count
+                        le = self._format_labels(labels, (("le", str(bound)),))
+                        lines.append(f"{name}_bucket{le} {cumulative}")
+                    inf = self._format_labels(labels, (("le", "+Inf"),))
+                    lines.append(f"{name}_bucket{inf} {count}")
+                    lines.append(f"{name}_sum{self._format_labels(labels)} {total}")
+                    lines.append(f"{name}_count{self._format_labels(labels)} {count}")
+        return "\n".join(lines) + "\n"
+
+
+metrics = Metrics()
+
+# 현재 브리핑 실행의 스팬 목록 (run_briefing이 설정, 작업 스레드로는 submit_in_context로 전달)
+_current_trace = contextvars.ContextVar("current_trace", default=None)
+
+
+def submit_in_context(executor, fn, *args):
+    """현재 contextvars(실행 트레이스 등)를 유지한 채 작업을 스레드 풀에 제출한다."""
+    return executor.submit(contextvars.copy_context().run, fn, *args)
+
+
+@contextmanager
+def trace_span(name: str, target: str = "", **attrs):
+    """구간 소요 시간과 속성(bytes, entries, prompt_chars 등)을 기록하는 스팬.
+
+    블록 안에서 yield된 dict에 속성을 채우면, 종료 시 메트릭에 반영되고
+    실행 중인 브리핑이 있으면 그 트레이스에 추가된다.
+    """
+    span = {"span": name, "target": target, **attrs}
+    started = time.perf_counter()
+    try:
+        yield span
+    except BaseException:
+        span["error"] = True
+        raise
+    finally:
+        duration = time.perf_counter() - started
+        span["duration_ms"] = round(duration * 1000, 1)
+        _record_span(span, duration)
+
+
+def _record_span(span: dict, duration: float) -> None:
+    name, target = span["span"], span["target"]
+    metrics.observe(
+        "ai_secretary_span_duration_seconds", duration, SPAN_DURATION_BUCKETS,
+        "Duration of outbound calls and processing stages",
+        span=name, target=target, outcome="error" if span.get("error") else "ok",
+    )
+    if span.get("bytes"):
+        metrics.inc("ai_secretary_span_bytes_total", span["bytes"],
+                    "Bytes transferred per span", span=name, target=target)
+    if "entries" in span:
+        metrics.inc("ai_secretary_rss_entries_total", span["entries"],
+                    "RSS entries kept inside the time window", target=target)
+    if "removed" in span:
+        metrics.inc("ai_secretary_dedup_removed_total", span["removed"],
+                    "Duplicate feed entries collapsed before summarisation")
+    if "dropped" in span:
+        metrics.inc("ai_secretary_prompt_dropped_entries_total", span["dropped"],
+                    "Feed entries left out of prompts by the token budget", section=target)
+    if "prompt_chars" in span:
+        metrics.observe("ai_secretary_gemini_prompt_chars", span["prompt_chars"], SIZE_BUCKETS,
+                        "Gemini prompt size in characters")
+    if "response_chars" in span:
+        metrics.observe("ai_secretary_gemini_response_chars", span["response_chars"], SIZE_BUCKETS,
+                        "Gemini response size in characters")
+
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.append(span)
+
+
+def summarize_trace(spans: list[dict]) -> dict:
+    """스팬 목록을 이름별 횟수/합계/최대 소요 시간과 크기 합계로 요약."""
+    summary = {}
+    for span in spans:
+        item = summary.setdefault(span["span"], {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+        item["count"] += 1
+        item["total_ms"] = round(item["total_ms"] + span["duration_ms"], 1)
+        item["max_ms"] = max(item["max_ms"], span["duration_ms"])
+        for key in ("bytes", "entries", "removed", "dropped", "chunks", "prompt_tokens", "prompt_chars", "response_chars"):
+            if key in span:
+                item[key] = item.get(key, 0) + span[key]
+        if span.get("error"):
+            item["errors"] = item.get("errors", 0) + 1
+    return summary
+
+
+# ─── 외부 호출 (서킷 브레이커 / 재시도 / 헤징) ──────────────────────────
+class CircuitOpenError(RuntimeError):
+    """서킷이 열려 있어 호출하지 않고 건너뜀."""
+
+
+class CircuitBreaker:
+    """대상별 서킷 브레이커.
+
+    연속 `failures`회 실패하면 열려서 `cooldown`초 동안 호출을 막고,
+    이후 한 번의 시험 호출(half-open)이 성공하면 다시 닫힌다.
+    """
+
+    def __init__(self, target: str, failures: int = BREAKER_FAILURES, cooldown: float = BREAKER_COOLDOWN):
+        self.target = target
+        self.failures = failures
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._state = "closed"
+        self._consecutive = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._last_error = None
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._state == "open" and time.monotonic() - self._opened_at >= self.cooldown:
+                self._transition("half_open")
+            if self._state == "closed":
+                return True
+            if self._state == "half_open" and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._consecutive = 0
+            self._probing = False
+            if self._state != "closed":
+                self._transition("closed")
+
+    def record_failure(self, error: Exception) -> None:
+        with self._lock:
+            self._consecutive += 1
+            self._probing = False
+            self._last_error = f"{type(error).__name__}: {error}"[:200]
+            if self._state == "half_open" or self._consecutive >= self.failures:
+                self._opened_at = time.monotonic()
+                if self._state != "open":
+                    self._transition("open")
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            info = {"state": self._state, "consecutive_failures": self._consecutive}
+            if self._state == "open":
+                info["retry_in_s"] = round(max(0.0, self.cooldown - (time.monotonic() - self._opened_at)), 1)
+            if self._last_error:
+                info["last_error"] = self._last_error
+            return info
+
+    def _transition(self, state: str) -> None:
+        logger.warning("Circuit %s: %s → %s", self.target, self._state, state)
+        self._state = state
+        metrics.inc("ai_secretary_breaker_transitions_total", 1,
+                    "Circuit breaker state changes", target=self.target, state=state)
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+# 실행 1회의 마감 시각 (time.monotonic 기준). 섹션 스레드에는 submit_in_context로 전파된다.
+_run_deadline = contextvars.ContextVar("run_deadline", default=None)
+
+# 헤징용 스레드 풀 (원 요청과 중복 요청을 함께 실행)
+_hedge_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="hedge")
+
+
+def get_breaker(target: str) -> CircuitBreaker:
+    with _breakers_lock:
+        if target not in _breakers:
+            _breakers[target] = CircuitBreaker(target)
+        return _breakers[target]
+
+
+def breaker_states() -> dict[str, dict]:
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {b.target: b.snapshot() for b in breakers}
+
+
+TRANSIENT_ERRORS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+    ConnectionError,
+    TimeoutError,
+)
+
+
+def error_status(error: Exception) -> int | None:
+    """오류에 담긴 HTTP 상태 코드 (없으면 None)."""
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code
+    if isinstance(getattr(error, "code", None), int):
+        return error.code  # google.api_core 예외는 HTTP 상태 코드를 code로 가진다
+    return None
+
+
+def is_retryable(error: Exception) -> bool:
+    """일시적인 오류인지 판단: 네트워크·타임아웃, 5xx, 408/429만.
+
+    그 밖의 오류(4xx, 안전 필터로 막힌 Gemini 응답의 ValueError 등)는 다시 보내도
+    결과가 같으므로 재시도하지 않는다.
+    """
+    if isinstance(error, CircuitOpenError):
+        return False
+    status = error_status(error)
+    if status is not None:
+        return status >= 500 or status in (408, 429)
+    return isinstance(error, TRANSIENT_ERRORS)
+
+
+def _hedged(fn, timeout: float, hedge_after: float):
+    """`hedge_after`초 안에 끝나지 않으면 같은 요청을 하나 더 보내 먼저 성공한 결과를 쓴다."""
+    first = submit_in_context(_hedge_executor, fn, timeout)
+    done, _ = wait([first], timeout=hedge_after)
+    if done:
+        return first.result()
+
+    metrics.inc("ai_secretary_hedged_requests_total", 1, "Duplicate requests sent for slow responses")
+    pending = {first, submit_in_context(_hedge_executor, fn, max(0.1, timeout - hedge_after))}
+    error = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                return future.result()
+            error = future.exception()
+    raise error
+
+
+def call_outbound(
+    target: str,
+    fn,
+    timeout: float,
+    deadline: float | None = None,
+    retries: int = OUTBOUND_RETRIES,
+    hedge_after: float = 0,
+):
+    """외부 호출 공통 경로: 서킷 브레이커 → (헤징) 호출 → 지터 재시도.
+
+    `fn(timeout)`은 주어진 제한 시간 안에 한 번 호출을 수행한다. 제한 시간은
+    `deadline`과 실행 전체 마감(`RUN_DEADLINE`) 중 이른 쪽을 넘지 않게 줄어든다.
+    """
+    breaker = get_breaker(target)
+    run_deadline = _run_deadline.get()
+    limits = [d for d in (deadline, run_deadline) if d is not None]
+    deadline = min(limits) if limits else None
+
+    if deadline is not None and deadline <= time.monotonic():
+        # 실행 자체의 시간 예산이 다 된 것이므로 대상의 실패로 세지 않는다
+        raise TimeoutError(f"deadline exceeded before calling {target}")
+    # 브레이커는 논리적 호출 1회에 한 번만 묻고 결과도 마지막 시도 뒤에 한 번만 기록한다
+    # (half-open 시험 호출이 재시도 중에 스스로 막혀 시험 상태에 갇히지 않도록)
+    if not breaker.allow():
+        raise CircuitOpenError(f"circuit open for {target}")
+
+    attempt = 0
+    while True:
+        remaining = timeout if deadline is None else min(timeout, deadline - time.monotonic())
+        try:
+            if remaining <= 0:
+                raise TimeoutError(f"deadline exceeded while retrying {target}")
+            result = _hedged(fn, remaining, hedge_after) if hedge_after > 0 else fn(remaining)
+        except Exception as e:
+            if not is_retryable(e) and error_status(e) is None:
+                # 상태 코드 없는 결정적 오류(응답 내용 문제 등): 대상은 정상 응답했으므로 실패로 세지 않음
+                breaker.record_success()
+                raise
+            if not is_retryable(e) or attempt >= retries or remaining <= 0:
+                breaker.record_failure(e)
+                raise
+            # full jitter 지수 백오프
+            backoff = random.uniform(0, min(0.5 * 2 ** attempt, 8.0))
+            if deadline is not None and time.monotonic() + backoff >= deadline:
+                breaker.record_failure(e)
+                raise
+            attempt += 1
+            logger.warning("%s call failed (%s), retry %d in %.2fs", target, e, attempt, backoff)
+            metrics.inc("ai_secretary_outbound_retries_total", 1, "Retried outbound calls", target=target)
+            time.sleep(backoff)
+            continue
+        breaker.record_success()
+        return result
+
+
 # ═════════════════════════════════════════════════════════════════════════
 #  1) 날씨
 # ═════════════════════════════════════════════════════════════════════════
 
-def fetch_weather() -> dict:
-    base_params = {
-        "q": CITY,
-        "appid": OPENWEATHER_API_KEY,
-        "units": "metric",
-        "lang": "kr",
-    }
+WEATHER_HORIZON = timedelta(hours=24)  # 그래프에 쓰는 예보 범위
 
-    # 현재 날씨
-    r = requests.get(
-        "https://api.openweathermap.org/data/2.5/weather",
-        params=base_params,
-        timeout=10,
-    )
-    r.raise_for_status()
-    current = r.json()
-
-    # 시간별 예보
-    r = requests.get(
-        "https://api.openweathermap.org/data/2.5/forecast",
-        params=base_params,
-        timeout=10,
-    )
-    r.raise_for_status()
-    forecast = r.json()
 
-    now = datetime.now(TZ)
+def _openweather_get(url: str, params: dict) -> requests.Response:
+    def attempt(timeout: float) -> requests.Response:
+        r = get_http_session().get(url, params=params, timeout=timeout)
+        r.raise_for_status()
+        return r
+
+    return call_outbound("openweather", attempt, timeout=10, hedge_after=HEDGE_AFTER)
+
+
+def parse_hourly(items: list, now: datetime, temp=lambda item: item["main"]["temp"]) -> list[dict]:
+    """시간순 예보에서 `WEATHER_HORIZON` 이내 항목만 뽑는다 (범위를 넘으면 나머지는 보지 않음)."""
+    horizon = now + WEATHER_HORIZON
     hourly_temps = []
-    for item in forecast["list"]:
+    for item in items:
         dt = datetime.fromtimestamp(item["dt"], TZ)
-        if dt <= now + timedelta(hours=24):
-            hourly_temps.append(
-                {
-                    "time": dt.strftime("%H:%M"),
-                    "temp": item["main"]["temp"],
-                    "icon": item["weather"][0]["icon"],
-                    "pop": item.get("pop", 0),  # 강수 확률
-                }
+        if dt > horizon:
+            break
+        hourly_temps.append(
+            {
+                "time": dt.strftime("%H:%M"),
+                "temp": temp(item),
+                "icon": item["weather"][0]["icon"],
+                "pop": item.get("pop", 0),  # 강수 확률
+            }
+        )
+    return hourly_temps
+
+
+class WeatherProvider:
+    """OpenWeather 데이터 공급 계층. (도시, 단위)별로 `ttl`초 동안 결과를 캐시한다.
+
+    강제 재실행이나 같은 도시를 쓰는 여러 구독·동시 실행은 캐시된 데이터를 쓰고,
+    같은 키를 동시에 요청하면 한 번만 호출한다. 통합 엔드포인트(`onecall_url`)가
+    설정되면 호출 1회로, 아니면 현재 날씨와 예보를 동시에 받아온다.
+    """
+
+    def __init__(self, ttl: float, onecall_url: str | None = None):
+        self.ttl = ttl
+        self.onecall_url = onecall_url
+        self._cache = {}  # (city, units) -> data
+        self._coords = {}  # city -> (lat, lon), 지오코딩 결과는 바뀌지 않으므로 계속 보관
+        self._locks = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="weather")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def get(self, city: str, units: str = "metric") -> dict:
+        key = (city, units)
+        with self._lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            cached = self._cache.get(key)
+            hit = cached is not None and time.time() - cached["fetched_at"] < self.ttl
+            metrics.inc("ai_secretary_weather_cache_lookups_total", 1,
+                        "Weather cache lookups", result="hit" if hit else "miss")
+            if hit:
+                return cached
+            with trace_span("fetch_weather", city) as span:
+                data = self._fetch(city, units, span)
+            data["fetched_at"] = time.time()
+            if self.ttl > 0:
+                self._cache[key] = data
+            return data
+
+    def _fetch(self, city: str, units: str, span: dict) -> dict:
+        params = {"appid": OPENWEATHER_API_KEY, "units": units, "lang": "kr"}
+        now = datetime.now(TZ)
+        if self.onecall_url:
+            lat, lon = self._geocode(city)
+            r = _openweather_get(
+                self.onecall_url,
+                {**params, "lat": lat, "lon": lon, "exclude": "minutely,daily,alerts"},
+            )
+            span["bytes"] = len(r.content)
+            body = r.json()
+            current = body["current"]
+            return {
+                "current": {
+                    "desc": current["weather"][0]["description"].capitalize(),
+                    "temp": current["temp"],
+                    "feels": current["feels_like"],
+                    "humidity": current["humidity"],
+                    "wind": current["wind_speed"],
+                    "icon": current["weather"][0]["icon"],
+                },
+                "hourly": parse_hourly(body.get("hourly", []), now, temp=lambda item: item["temp"]),
+            }
+
+        # 현재 날씨와 시간별 예보를 동시에 요청
+        params["q"] = city
+        forecast_future = submit_in_context(
+            self._executor, _openweather_get, f"{OPENWEATHER_BASE_URL}/forecast", params
+        )
+        r = _openweather_get(f"{OPENWEATHER_BASE_URL}/weather", params)
+        current = r.json()
+        span["bytes"] = len(r.content)
+        r = forecast_future.result()
+        forecast = r.json()
+        span["bytes"] += len(r.content)
+
+        return {
+            "current": {
+                "desc": current["weather"][0]["description"].capitalize(),
+                "temp": current["main"]["temp"],
+                "feels": current["main"]["feels_like"],
+                "humidity": current["main"]["humidity"],
+                "wind": current["wind"]["speed"],
+                "icon": current["weather"][0]["icon"],
+            },
+            "hourly": parse_hourly(forecast["list"], now),
+        }
+
+    def _geocode(self, city: str) -> tuple[float, float]:
+        if city not in self._coords:
+            r = _openweather_get(
+                f"{OPENWEATHER_GEO_URL}/direct", {"q": city, "limit": 1, "appid": OPENWEATHER_API_KEY}
             )
+            places = r.json()
+            if not places:
+                raise ValueError(f"unknown city: {city}")
+            self._coords[city] = (places[0]["lat"], places[0]["lon"])
+        return self._coords[city]
+
+
+weather_provider = WeatherProvider(WEATHER_CACHE_TTL, OPENWEATHER_ONECALL_URL)
 
-    return {
-        "current": {
-            "desc": current["weather"][0]["description"].capitalize(),
-            "temp": current["main"]["temp"],
-            "feels": current["main"]["feels_like"],
-            "humidity": current["main"]["humidity"],
-            "wind": current["wind"]["speed"],
-            "icon": current["weather"][0]["icon"],
-        },
-        "hourly": hourly_temps,
-    }
+
+def fetch_weather(city: str = CITY) -> dict:
+    return weather_provider.get(city)
 
 
 def create_temperature_graph(hourly_temps: list) -> str:
@@ -169,9 +996,17 @@ def create_temperature_graph(hourly_temps: list) -> str:
     return "\n".join(lines)
 
 
-def build_weather_embed(data: dict) -> dict:
+def weather_footer(data: dict) -> str:
+    """캐시된 데이터면 몇 분 전에 받은 것인지 함께 표시한다."""
+    age_min = int((time.time() - data.get("fetched_at", time.time())) // 60)
+    if age_min < 1:
+        return "Powered by OpenWeatherMap"
+    return f"Powered by OpenWeatherMap · {age_min}분 전 데이터"
+
+
+def build_weather_embed(data: dict, city: str = CITY) -> dict:
     icon_url = f"https://openweathermap.org/img/wn/{data['current']['icon']}@2x.png"
-    title = f"☀️ {CITY} 오늘의 날씨 ({datetime.now(TZ).strftime('%Y-%m-%d')})"
+    title = f"☀️ {city} 오늘의 날씨 ({datetime.now(TZ).strftime('%Y-%m-%d')})"
     graph = create_temperature_graph(data["hourly"])
 
     # 우산 추천 로직
@@ -218,7 +1053,7 @@ def build_weather_embed(data: dict) -> dict:
         "color": 0x3498DB,
         "thumbnail": {"url": icon_url},
         "fields": fields,
-        "footer": {"text": "Powered by OpenWeatherMap"},
+        "footer": {"text": weather_footer(data)},
     }
 
 
@@ -226,40 +1061,746 @@ def build_weather_embed(data: dict) -> dict:
 #  2) 뉴스 수집 & 요약
 # ═════════════════════════════════════════════════════════════════════════
 
-def fetch_rss_entries(rss_urls: list, hours: int = 24) -> list[str]:
-    """범용 RSS 수집 함수."""
-    now = datetime.now(TZ)
-    start = now - timedelta(hours=hours)
-    entries = []
+# 피드별 조건부 GET 캐시: url -> {"etag", "modified", "body", "headers"}
+_feed_cache = {}
+_feed_cache_lock = threading.Lock()
+
+
+def fetch_feed(rss_url: str, deadline: float) -> tuple[bytes, dict]:
+    """피드 원문(bytes)과 응답 헤더를 가져온다.
+
+    ETag / Last-Modified를 기억해 두었다가 304 응답이면 캐시된 본문을 돌려준다.
+    피드 1개당 `RSS_FEED_TIMEOUT`, 전체 `deadline`(time.monotonic 기준)을 넘기면 TimeoutError.
+    계속 실패하는 피드는 서킷이 열려 쿨다운 동안 건너뛴다 (CircuitOpenError).
+    """
+    feed_deadline = min(time.monotonic() + RSS_FEED_TIMEOUT, deadline)
+    return call_outbound(
+        rss_url,
+        lambda timeout: _fetch_feed_once(rss_url, timeout),
+        timeout=RSS_FEED_TIMEOUT,
+        deadline=feed_deadline,
+        hedge_after=HEDGE_AFTER,
+    )
 
-    for rss_url in rss_urls:
+
+def _fetch_feed_once(rss_url: str, timeout: float) -> tuple[bytes, dict]:
+    feed_deadline = time.monotonic() + timeout
+    with _feed_cache_lock:
+        cached = _feed_cache.get(rss_url)
+
+    headers = {}
+    if cached:
+        if cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached["modified"]:
+            headers["If-Modified-Since"] = cached["modified"]
+
+    with trace_span("rss_feed", urlsplit(rss_url).netloc) as span:
+        r = get_http_session().get(rss_url, headers=headers, timeout=timeout, stream=True)
+        with r:
+            span["status"] = r.status_code
+            if r.status_code == 304 and cached:
+                logger.info("Feed not modified: %s", rss_url)
+                return cached["body"], cached["headers"]
+            r.raise_for_status()
+
+            chunks = []
+            for chunk in r.iter_content(chunk_size=16384):
+                chunks.append(chunk)
+                if time.monotonic() > feed_deadline:
+                    raise TimeoutError(f"RSS read exceeded {timeout:.1f}s")
+            body = b"".join(chunks)
+            span["bytes"] = len(body)
+
+            # feedparser는 소문자 헤더 이름으로 인코딩/기준 URL을 찾는다
+            resp_headers = {k.lower(): v for k, v in r.headers.items()}
+            resp_headers["content-location"] = r.url
+            resp_headers.pop("content-encoding", None)  # requests가 이미 압축 해제함
+
+    etag, modified = r.headers.get("ETag"), r.headers.get("Last-Modified")
+    with _feed_cache_lock:
+        if etag or modified:
+            _feed_cache[rss_url] = {
+                "etag": etag,
+                "modified": modified,
+                "body": body,
+                "headers": resp_headers,
+            }
+        else:
+            _feed_cache.pop(rss_url, None)
+    return body, resp_headers
+
+
+@dataclass
+class FeedEntry:
+    """RSS 엔트리 한 건. 문자열로 바꾸면 프롬프트용 `- [출처] 제목 (링크)` 형식이 된다."""
+
+    source: str
+    title: str
+    link: str
+    published: datetime
+    feed_url: str = ""
+    sources: list[str] = field(default_factory=list)  # 중복 합치기로 묶인 출처들
+
+    def __str__(self) -> str:
+        sources = ", ".join(self.sources) if len(self.sources) > 1 else self.source
+        return f"- [{sources}] {self.title} ({self.link})"
+
+
+# 링크 비교 시 무시하는 추적용 쿼리 파라미터
+TRACKING_PARAMS = {"fbclid", "gclid", "igshid", "mc_cid", "mc_eid", "ref", "ref_src", "cmpid", "ns_mchannel", "ns_source", "ns_campaign", "ocid", "at_medium", "at_campaign"}
+
+
+def canonicalize_url(url: str) -> str:
+    """추적 파라미터/프래그먼트를 제거하고 호스트·쿼리를 정규화한 URL."""
+    parts = urlsplit(url.strip())
+    host = parts.hostname or ""
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit(("https" if parts.scheme in ("http", "https") else parts.scheme,
+                       host.lower().removeprefix("www."), path, urlencode(query), ""))
+
+
+def url_hash(url: str) -> str:
+    return hashlib.sha1(canonicalize_url(url).encode("utf-8")).hexdigest()
+
+
+# ─── 중복 기사 합치기 (URL 정규화 + 제목 MinHash) ─────────────────────────
+MINHASH_BANDS = 8
+MINHASH_ROWS = 4  # 밴드당 행 수. 후보 임계값 ≈ (1/8)^(1/4) ≈ 0.59
+_minhash_rng = random.Random(0x5EC7)  # 프로세스 간에 같은 서명이 나오도록 고정 시드
+# 64비트 해시에 XOR할 마스크 = 순열 대용 (곱셈·나머지 방식보다 몇 배 빠름)
+MINHASH_MASKS = [_minhash_rng.getrandbits(64) for _ in range(MINHASH_BANDS * MINHASH_ROWS)]
+
+
+def title_shingles(title: str, size: int = 3) -> set[str]:
+    """문장 부호와 공백을 뺀 소문자 제목의 글자 단위 n-gram.
+
+    공백을 모두 지운 뒤 자르므로 띄어쓰기만 다른 제목("출시 일정" / "출시일정")은 같은 n-gram이 된다.
+    """
+    text = "".join(re.findall(r"\w+", title.lower()))
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def minhash_signature(shingles: set[str]) -> tuple[int, ...]:
+    hashes = [
+        int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big")
+        for s in shingles
+    ]
+    return tuple(min(h ^ mask for h in hashes) for mask in MINHASH_MASKS)
+
+
+def dedupe_entries(entries: list[FeedEntry], threshold: float = FEED_DEDUP_THRESHOLD) -> list[FeedEntry]:
+    """같은 링크(정규화 후)나 거의 같은 제목의 엔트리를 하나로 합친다.
+
+    먼저 나온 엔트리가 대표가 되고 나머지의 출처는 `sources`에 덧붙는다.
+    제목은 MinHash LSH로 후보 쌍을 고른 뒤 실제 Jaccard 유사도로 확인한다.
+    """
+    parent = list(range(len(entries)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(i, j):
+        ri, rj = find(i), find(j)
+        if ri != rj:
+            parent[max(ri, rj)] = min(ri, rj)
+
+    by_link = {}
+    buckets = {}
+    signatures = {}  # 같은 제목은 한 번만 서명 계산 (피드 간 동일 제목이 흔함)
+    shingles = [title_shingles(e.title) for e in entries]
+    for i, entry in enumerate(entries):
+        key = url_hash(entry.link)
+        if key in by_link:
+            union(by_link[key], i)
+        else:
+            by_link[key] = i
+
+        if not shingles[i]:
+            continue
+        title_key = entry.title.lower()
+        if title_key not in signatures:
+            signatures[title_key] = minhash_signature(shingles[i])
+        signature = signatures[title_key]
+        for band in range(MINHASH_BANDS):
+            rows = signature[band * MINHASH_ROWS:(band + 1) * MINHASH_ROWS]
+            for j in buckets.setdefault((band, rows), []):
+                if find(i) == find(j):
+                    continue
+                overlap = len(shingles[i] & shingles[j])
+                if overlap / len(shingles[i] | shingles[j]) >= threshold:
+                    union(i, j)
+            buckets[(band, rows)].append(i)
+
+    merged = {}
+    for i, entry in enumerate(entries):
+        head = merged.setdefault(find(i), entry)
+        if not head.sources:
+            head.sources.append(head.source)
+        if entry is not head and entry.source not in head.sources:
+            head.sources.append(entry.source)
+    return list(merged.values())
+
+
+# ─── 경량 RSS/Atom 파서 (feedparser 대신 쓰는 빠른 경로) ─────────────────
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+DC_DATE = "{http://purl.org/dc/elements/1.1/}date"
+FAST_PARSE_CHUNK = 16384
+FAST_PARSE_STOP_AFTER = 3  # 날짜순 피드에서 기간 밖 엔트리가 연속 이만큼 나오면 중단
+FAST_PARSE_VERIFY_EVERY = 20  # 조기 중단·폴백을 이만큼 한 피드는 다음 한 번을 경량 파서로 끝까지 읽어 다시 확인
+
+# 피드 URL -> (끝까지 읽었을 때 최신순이었는지, 그 뒤 조기 중단 횟수)
+_feed_order = {}
+# 피드 URL -> 경량 파서가 실패한 뒤 바로 feedparser로 읽은 횟수
+_fast_parse_fallbacks = {}
+_feed_order_lock = threading.Lock()
+
+
+class FeedFormatError(ValueError):
+    """빠른 경로로 처리할 수 없는 피드 (feedparser로 폴백)."""
+
+
+def parse_feed_date(text: str) -> datetime:
+    """RFC 822(RSS) 또는 ISO 8601(Atom) 날짜. feedparser와 같이 초 단위로 자른다."""
+    text = text.strip()
+    try:
+        dt = parsedate_to_datetime(text)
+    except (TypeError, ValueError):
         try:
-            feed = feedparser.parse(rss_url)
-            source = (
-                feed.feed.title
-                if hasattr(feed.feed, "title")
-                else rss_url.split("/")[2]
-            )
+            dt = datetime.fromisoformat(text)
+        except ValueError:
+            raise FeedFormatError(f"unsupported date: {text!r}") from None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=pytz.utc)
+    return dt.astimezone(TZ).replace(microsecond=0)
+
+
+def _fast_entry(elem, atom: bool) -> tuple[str | None, str | None, datetime | None]:
+    if atom:
+        title_elem = elem.find(f"{ATOM_NS}title")
+        if title_elem is not None and (title_elem.get("type") == "xhtml" or len(title_elem)):
+            raise FeedFormatError("xhtml title")
+        title = title_elem.text if title_elem is not None else None
+        link = None
+        for link_elem in elem.findall(f"{ATOM_NS}link"):
+            if link_elem.get("rel", "alternate") == "alternate":
+                link = link_elem.get("href")
+                break
+        date_text = elem.findtext(f"{ATOM_NS}published") or elem.findtext(f"{ATOM_NS}updated")
+    else:
+        title = elem.findtext("title")
+        link = elem.findtext("link")
+        if not link and elem.find("guid") is not None:
+            raise FeedFormatError("guid used as link")  # feedparser의 permalink 규칙에 맡김
+        date_text = elem.findtext("pubDate") or elem.findtext(DC_DATE)
+
+    if title is not None and "<" in title:
+        raise FeedFormatError("markup in title")
+    if link and not link.strip().lower().startswith(("http://", "https://")):
+        raise FeedFormatError("relative link")
+    published = parse_feed_date(date_text) if date_text and date_text.strip() else None
+    return title, link, published
+
+
+def fast_parse_feed(
+    body: bytes, since: datetime | None = None, stop_early: bool = False
+) -> tuple[str | None, list[tuple[str, str, datetime]], bool | None]:
+    """RSS 2.0 / Atom 피드에서 (피드 제목, [(제목, 링크, 발행 시각)], 최신순 여부)를 점진적으로 뽑는다.
+
+    `stop_early`이면(이전에 끝까지 읽어 최신순임을 확인한 피드) `since`보다 오래된 엔트리가
+    연속으로 나올 때 나머지를 파싱하지 않고 멈추며, 이때 최신순 여부는 None이다.
+    처음 보는 피드는 끝까지 읽어야 뒤쪽의 새 엔트리를 놓치지 않는다.
+    처리할 수 없는 형식이면 ET.ParseError 또는 ValueError(FeedFormatError, expat 미지원
+    인코딩)를 던지므로 호출 측에서 feedparser로 폴백한다.
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    stack = []
+    atom = None
+    feed_title = None
+    items = []
+    last_published = None
+    ordered = True
+    older_run = 0
+
+    for offset in range(0, len(body), FAST_PARSE_CHUNK):
+        parser.feed(body[offset:offset + FAST_PARSE_CHUNK])
+        for event, elem in parser.read_events():
+            if event == "start":
+                if not stack:
+                    if elem.tag not in ("rss", f"{ATOM_NS}feed"):
+                        raise FeedFormatError(f"unsupported root: {elem.tag}")
+                    atom = elem.tag == f"{ATOM_NS}feed"
+                stack.append(elem.tag)
+                continue
 
-            for e in feed.entries:
-                try:
-                    pub = parse_entry_date(e)
-                    if pub is None:
-                        continue  # 날짜 없으면 건너뜀
-
-                    if pub >= start and hasattr(e, "title") and hasattr(e, "link"):
-                        entries.append(
-                            f"- [{source}] {e.title.strip()} ({e.link.strip()})"
-                        )
-                except Exception as entry_err:
-                    logger.warning("Entry parse error (%s): %s", rss_url, entry_err)
+            stack.pop()
+            parent = stack[-1] if stack else None
+            if elem.tag in ("title", f"{ATOM_NS}title") and parent in ("channel", f"{ATOM_NS}feed"):
+                feed_title = (elem.text or "").strip()
+                continue
+            if elem.tag != (f"{ATOM_NS}entry" if atom else "item"):
+                continue
+
+            title, link, published = _fast_entry(elem, atom)
+            elem.clear()
+            if published is None:
+                continue  # 날짜 없으면 건너뜀 (feedparser 경로와 동일)
+            if last_published is not None and published > last_published:
+                ordered = False
+            last_published = published
+
+            if since is not None and published < since:
+                older_run += 1
+                if stop_early and ordered and older_run >= FAST_PARSE_STOP_AFTER:
+                    return feed_title, items, None
+                continue
+            older_run = 0
+            if title is not None and link:
+                items.append((title.strip(), link.strip(), published))
+
+    parser.close()
+    if atom is None:
+        raise FeedFormatError("empty document")
+    return feed_title, items, ordered
+
+
+def parse_feed_entries(
+    rss_url: str, body: bytes, headers: dict, since: datetime | None = None
+) -> list[FeedEntry]:
+    """피드 본문을 파싱해 (`since` 이후) 날짜가 있는 엔트리를 피드 순서대로 반환.
+
+    `FEED_FAST_PARSE`이면 경량 파서를 먼저 쓰고, 처리할 수 없는 피드만 feedparser로 읽는다.
+    경량 파서의 조기 중단은 이전에 끝까지 읽었을 때 최신순이었던 피드에만 쓰고,
+    경량 파서가 실패한 피드는 다시 확인할 때까지 바로 feedparser로 읽는다.
+    """
+    with trace_span("rss_parse", urlsplit(rss_url).netloc, bytes=len(body)) as span:
+        fast = FEED_FAST_PARSE
+        if fast:
+            with _feed_order_lock:
+                known_ordered, stops = _feed_order.get(rss_url, (False, 0))
+                fallbacks = _fast_parse_fallbacks.get(rss_url)
+                if fallbacks is not None and fallbacks < FAST_PARSE_VERIFY_EVERY:
+                    _fast_parse_fallbacks[rss_url] = fallbacks + 1
+                    fast = False
+        if fast:
+            stop_early = known_ordered and stops < FAST_PARSE_VERIFY_EVERY
+            try:
+                feed_title, items, ordered = fast_parse_feed(body, since, stop_early)
+            except (ET.ParseError, ValueError) as e:  # FeedFormatError, 미지원 인코딩 등
+                logger.debug("Fast feed parse fell back to feedparser (%s): %s", rss_url, e)
+                with _feed_order_lock:
+                    _fast_parse_fallbacks[rss_url] = 0
+            else:
+                with _feed_order_lock:
+                    if ordered is None:
+                        _feed_order[rss_url] = (known_ordered, stops + 1)
+                        metrics.inc("ai_secretary_feed_early_stops_total", 1,
+                                    "Feed parses stopped early on date-ordered feeds",
+                                    target=urlsplit(rss_url).netloc)
+                    else:
+                        _feed_order[rss_url] = (ordered, 0)
+                    _fast_parse_fallbacks.pop(rss_url, None)
+                source = feed_title if feed_title is not None else rss_url.split("/")[2]
+                entries = [FeedEntry(source, t, l, pub, rss_url) for t, l, pub in items]
+                span.update(parser="fast", entries=len(entries))
+                return entries
+
+        span["parser"] = "feedparser"
+        feed = feedparser.parse(body, response_headers=headers)
+        source = (
+            feed.feed.title
+            if hasattr(feed.feed, "title")
+            else rss_url.split("/")[2]
+        )
+
+        entries = []
+        for e in feed.entries:
+            try:
+                pub = parse_entry_date(e)
+                if pub is None:
+                    continue  # 날짜 없으면 건너뜀
+                if since is not None and pub < since:
+                    continue
+
+                if hasattr(e, "title") and hasattr(e, "link"):
+                    entries.append(
+                        FeedEntry(source, e.title.strip(), e.link.strip(), pub, rss_url)
+                    )
+            except Exception as entry_err:
+                logger.warning("Entry parse error (%s): %s", rss_url, entry_err)
+        span["entries"] = len(entries)
+    return entries
+
+
+def download_feeds(rss_urls: list, since: datetime | None = None) -> dict[str, list[FeedEntry]]:
+    """모든 피드를 동시에 받아 `since` 이후 엔트리를 파싱한다. 실패/시간 초과한 피드는 빠진다."""
+    results = {}
+    if not rss_urls:
+        return results
+
+    deadline = time.monotonic() + RSS_TOTAL_TIMEOUT
+    executor = ThreadPoolExecutor(max_workers=len(rss_urls), thread_name_prefix="rss")
+    futures = {url: submit_in_context(executor, fetch_feed, url, deadline) for url in rss_urls}
+    executor.shutdown(wait=False)
+    wait(futures.values(), timeout=max(0.0, deadline - time.monotonic()))
+
+    for rss_url in rss_urls:
+        future = futures[rss_url]
+        if not future.done():
+            logger.warning("Feed fetch timed out (%s)", rss_url)
+            continue
+        try:
+            body, headers = future.result()
+            results[rss_url] = parse_feed_entries(rss_url, body, headers, since)
         except Exception as feed_err:
             logger.warning("Feed fetch error (%s): %s", rss_url, feed_err)
+    return results
+
+
+class FeedStore:
+    """피드 엔트리를 누적 저장하는 SQLite 저장소.
+
+    엔트리는 피드별로 정규화한 링크의 해시로 중복 제거하고 발행 시각에 인덱스를 둔다
+    (여러 피드에 실린 같은 기사는 피드마다 따로 남아 출처를 잃지 않는다).
+    백그라운드 수집기(`run_feed_ingestion`)가 채워 두면 브리핑 시점에는
+    네트워크 없이 범위 질의 한 번으로 엔트리를 가져온다.
+    """
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._db = LazySqlite(
+            path,
+            "CREATE TABLE IF NOT EXISTS feed_entries ("
+            " feed_url TEXT NOT NULL, url_hash TEXT NOT NULL, source TEXT NOT NULL,"
+            " title TEXT NOT NULL, link TEXT NOT NULL,"
+            " published_at REAL NOT NULL, ingested_at REAL NOT NULL,"
+            " PRIMARY KEY (feed_url, url_hash));"
+            "CREATE INDEX IF NOT EXISTS idx_feed_entries_feed_published"
+            " ON feed_entries (feed_url, published_at);"
+            "CREATE INDEX IF NOT EXISTS idx_feed_entries_published"
+            " ON feed_entries (published_at);"
+            "CREATE TABLE IF NOT EXISTS feed_state ("
+            " feed_url TEXT PRIMARY KEY, ingested_at REAL NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS briefing_marks ("
+            " name TEXT PRIMARY KEY, at REAL NOT NULL);",
+        )
+
+    def ingest(self, rss_url: str, entries: list[FeedEntry]) -> int:
+        """엔트리를 upsert하고 피드의 마지막 수집 시각을 갱신. 새로 추가된 건수를 반환."""
+        now = time.time()
+        with self._lock:
+            conn = self._db.conn
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT INTO feed_entries"
+                " (url_hash, feed_url, source, title, link, published_at, ingested_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT(feed_url, url_hash) DO NOTHING",
+                [
+                    (url_hash(e.link), rss_url, e.source, e.title, e.link,
+                     e.published.timestamp(), now)
+                    for e in entries
+                ],
+            )
+            added = conn.total_changes - before
+            conn.execute(
+                "INSERT OR REPLACE INTO feed_state (feed_url, ingested_at) VALUES (?, ?)",
+                (rss_url, now),
+            )
+            conn.execute(
+                "DELETE FROM feed_entries WHERE published_at < ?",
+                (now - FEED_STORE_RETENTION_DAYS * 86400,),
+            )
+            conn.commit()
+        return added
+
+    def fresh_feeds(self, rss_urls: list, max_age: float) -> set:
+        """`max_age`초 이내에 수집된 피드 URL 집합."""
+        if not rss_urls:
+            return set()
+        marks = ",".join("?" * len(rss_urls))
+        with self._lock:
+            rows = self._db.conn.execute(
+                f"SELECT feed_url FROM feed_state WHERE feed_url IN ({marks}) AND ingested_at >= ?",
+                (*rss_urls, time.time() - max_age),
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def entries_since(self, rss_urls: list, start: datetime) -> dict[str, list[FeedEntry]]:
+        """피드별로 `start` 이후 발행된 엔트리 (최신순)."""
+        results = {url: [] for url in rss_urls}
+        if not rss_urls:
+            return results
+        marks = ",".join("?" * len(rss_urls))
+        with self._lock:
+            rows = self._db.conn.execute(
+                "SELECT feed_url, source, title, link, published_at FROM feed_entries"
+                f" WHERE feed_url IN ({marks}) AND published_at >= ?"
+                " ORDER BY published_at DESC",
+                (*rss_urls, start.timestamp()),
+            ).fetchall()
+        for feed_url, source, title, link, published_at in rows:
+            published = datetime.fromtimestamp(published_at, TZ)
+            results[feed_url].append(FeedEntry(source, title, link, published, feed_url))
+        return results
+
+    def last_briefing(self, name: str) -> datetime | None:
+        with self._lock:
+            row = self._db.conn.execute(
+                "SELECT at FROM briefing_marks WHERE name = ?", (name,)
+            ).fetchone()
+        return datetime.fromtimestamp(row[0], TZ) if row else None
+
+    def mark_briefing(self, name: str, at: datetime) -> None:
+        with self._lock:
+            self._db.conn.execute(
+                "INSERT OR REPLACE INTO briefing_marks (name, at) VALUES (?, ?)",
+                (name, at.timestamp()),
+            )
+            self._db.conn.commit()
+
+
+feed_store = FeedStore(FEED_STORE_PATH) if FEED_STORE_PATH else None
+
+
+def run_feed_ingestion() -> None:
+    """모든 피드를 한 번 받아 저장소에 적재 (백그라운드 수집기 1회분)."""
+    if feed_store is None:
+        return
+    urls = NEWS_RSS_URLS + GAMING_RSS_URLS
+    with trace_span("feed_ingest", entries=0) as span:
+        since = datetime.now(TZ) - timedelta(days=FEED_STORE_RETENTION_DAYS)
+        for rss_url, entries in download_feeds(urls, since).items():
+            span["entries"] += feed_store.ingest(rss_url, entries)
+    logger.info("Feed ingestion: %d new entries from %d feeds", span["entries"], len(urls))
 
+
+def _feed_ingestion_loop() -> None:
+    while True:
+        try:
+            run_feed_ingestion()
+        except Exception as e:
+            logger.error("Feed ingestion error: %s", e)
+        time.sleep(FEED_INGEST_INTERVAL)
+
+
+def collect_entries(
+    rss_urls: list, hours: int = 24, since: datetime | None = None
+) -> list[FeedEntry]:
+    """최근 `hours`시간(및 `since` 이후) 엔트리를 피드 순서대로 수집한다.
+
+    피드 저장소가 있으면 최근에 수집된 피드는 인덱스 질의로, 그렇지 않은 피드만
+    네트워크로 받아 오며 받아 온 결과는 저장소에도 적재한다.
+    """
+    start = datetime.now(TZ) - timedelta(hours=hours)
+    if since is not None:
+        start = max(start, since)
+
+    by_feed = {}
+    stale = list(rss_urls)
+    if feed_store is not None:
+        max_age = max(FEED_INGEST_INTERVAL * 2, 300)
+        fresh = feed_store.fresh_feeds(rss_urls, max_age)
+        stale = [url for url in rss_urls if url not in fresh]
+        with trace_span("feed_store_query", entries=0) as span:
+            by_feed.update(feed_store.entries_since(sorted(fresh), start))
+            span["entries"] = sum(len(v) for v in by_feed.values())
+
+    for rss_url, entries in download_feeds(stale, start).items():
+        if feed_store is not None:
+            feed_store.ingest(rss_url, entries)
+        by_feed[rss_url] = entries
+
+    entries = [entry for url in rss_urls for entry in by_feed.get(url, [])]
+    if FEED_DEDUP and entries:
+        with trace_span("feed_dedup", removed=0) as span:
+            unique = dedupe_entries(entries)
+            span["removed"] = len(entries) - len(unique)
+        if span["removed"]:
+            logger.info("Feed dedup: %d → %d entries", len(entries), len(unique))
+        entries = unique
     return entries
 
 
-def summarize_news(entries: list[str]) -> str:
+def fetch_rss_entries(
+    rss_urls: list, hours: int = 24, since: datetime | None = None
+) -> list[str]:
+    """범용 RSS 수집 함수. 모든 피드를 동시에 받아 온 뒤 순서대로 파싱한다."""
+    return [str(e) for e in collect_entries(rss_urls, hours, since)]
+
+
+# ─── 프롬프트 조립 (토큰 예산 + 엔트리 순위) ─────────────────────────────
+RECENCY_HALF_LIFE_HOURS = 12
+
+
+def parse_source_weights(spec: str) -> dict[str, float]:
+    """`"호스트 또는 출처명=가중치,..."` 형식을 파싱 (잘못된 항목은 무시)."""
+    weights = {}
+    for item in spec.split(","):
+        key, sep, value = item.partition("=")
+        try:
+            if sep:
+                weights[key.strip().lower()] = float(value)
+        except ValueError:
+            logger.warning("Invalid FEED_SOURCE_WEIGHTS item: %s", item)
+    return weights
+
+
+SOURCE_WEIGHTS = parse_source_weights(FEED_SOURCE_WEIGHTS)
+
+
+def estimate_tokens(text: str) -> int:
+    """토크나이저 없이 쓰는 대략적인 토큰 수 (영문 약 4자/토큰, 한글 등은 약 1.5자/토큰)."""
+    ascii_chars = sum(1 for ch in text if ch.isascii())
+    return math.ceil(ascii_chars / 4 + (len(text) - ascii_chars) / 1.5)
+
+
+def source_weight(entry: FeedEntry) -> float:
+    host = (urlsplit(entry.feed_url).hostname or "").lower()
+    for key, weight in SOURCE_WEIGHTS.items():
+        if key == entry.source.lower() or (host and host.endswith(key)):
+            return weight
+    return 1.0
+
+
+def entry_score(entry: FeedEntry, now: datetime) -> float:
+    """최신일수록, 여러 출처가 다룰수록, 출처 가중치가 클수록 높은 점수."""
+    age_hours = max(0.0, (now - entry.published).total_seconds() / 3600)
+    recency = 0.5 ** (age_hours / RECENCY_HALF_LIFE_HOURS)
+    coverage = 1 + math.log2(max(1, len(entry.sources)))
+    return source_weight(entry) * coverage * recency
+
+
+def build_entry_block(entries: list[FeedEntry], section: str) -> str:
+    """점수 순으로 엔트리를 골라 섹션 토큰 예산 안에서 프롬프트용 목록을 만든다.
+
+    예산을 넘는 엔트리는 빼고 몇 건을 뺐는지 로그로 남긴다.
+    """
+    budget = PROMPT_TOKEN_BUDGETS.get(section, PROMPT_TOKEN_BUDGET)
+    now = datetime.now(TZ)
+    lines, used, dropped = [], 0, []
+    with trace_span("prompt_build", section) as span:
+        for entry in sorted(entries, key=lambda e: entry_score(e, now), reverse=True):
+            line = str(entry)
+            cost = estimate_tokens(line) + 1  # 줄바꿈
+            if used + cost > budget:
+                dropped.append(entry)
+                continue
+            lines.append(line)
+            used += cost
+        span.update(dropped=len(dropped), prompt_tokens=used)
+
+    if dropped:
+        logger.info(
+            "Prompt budget (%s): kept %d/%d entries (~%d/%d tokens), dropped: %s",
+            section, len(lines), len(entries), used, budget,
+            "; ".join(e.title[:40] for e in dropped[:5]) + (" …" if len(dropped) > 5 else ""),
+        )
+    return "\n".join(lines)
+
+
+# ─── 묶음 요약 (map-reduce) ─────────────────────────────────────────────
+CHUNK_DIGEST_LINES = 10
+
+# 섹션과 무관한 map 프롬프트: 같은 묶음이면 뉴스/게임 뉴스/트렌드가 요약을 공유한다
+CHUNK_DIGEST_INSTRUCTIONS = f"""아래 뉴스 목록에서 중요한 기사를 골라 한 줄씩 요약해주세요.
+
+규칙:
+- 형식: - [출처] 핵심 내용 한 문장 (원문 링크)
+- 같은 사건을 다룬 기사는 한 줄로 합치고 출처를 함께 표기
+- 게임 타이틀, 회사, 수치 등 구체적 정보는 유지
+- 최대 {CHUNK_DIGEST_LINES}줄, 링크는 목록에 있는 것을 그대로 사용"""
+
+_inflight = {}  # 프롬프트 키 -> Future (같은 프롬프트 동시 요청 합치기)
+_inflight_lock = threading.Lock()
+
+
+def gemini_shared(prompt: str, ttl: float) -> str:
+    """같은 프롬프트가 동시에 요청되면 한 번만 호출하고 결과를 나눠 쓴다 (이후 재사용은 캐시)."""
+    key = GeminiCache.make_key(GEMINI_MODEL_NAME, prompt)
+    with _inflight_lock:
+        future = _inflight.get(key)
+        owner = future is None
+        if owner:
+            future = _inflight[key] = Future()
+    if not owner:
+        return future.result()
+
+    try:
+        text = gemini_generate(prompt, ttl)
+        future.set_result(text)
+        return text
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+def chunk_entries(entries: list[FeedEntry], max_entries: int, max_tokens: int) -> list[list[FeedEntry]]:
+    """최신순으로 정렬해 엔트리 수·토큰 수 한도 안에서 묶는다 (입력이 같으면 묶음도 같다)."""
+    chunks, current, used = [], [], 0
+    for entry in sorted(entries, key=lambda e: (e.published, e.link), reverse=True):
+        cost = estimate_tokens(str(entry)) + 1
+        if current and (len(current) >= max_entries or used + cost > max_tokens):
+            chunks.append(current)
+            current, used = [], 0
+        current.append(entry)
+        used += cost
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def digest_chunk(chunk: list[FeedEntry]) -> str:
+    """묶음 1개 요약 (map). 실패하면 원문 목록을 그대로 쓴다."""
+    prompt = f"{CHUNK_DIGEST_INSTRUCTIONS}\n\n뉴스 목록:\n" + "\n".join(str(e) for e in chunk)
+    try:
+        return gemini_shared(prompt, GEMINI_CACHE_TTLS["news_chunk"]).strip()
+    except Exception as e:
+        logger.warning("Chunk digest failed, using raw entries: %s", e)
+        return "\n".join(str(e) for e in chunk)
+
+
+def use_map_reduce(entries: list) -> bool:
+    if SUMMARY_STRATEGY in ("single", "map_reduce"):
+        return SUMMARY_STRATEGY == "map_reduce"
+    return len(entries) > MAP_REDUCE_THRESHOLD
+
+
+def news_context(entries: list[FeedEntry], section: str) -> str:
+    """요약 프롬프트에 넣을 뉴스 입력.
+
+    엔트리가 적으면 토큰 예산 안의 목록을 그대로, 많으면 묶음별로 나눠 병렬로
+    요약(map)한 결과를 넣는다. 이 경우 최종 프롬프트가 reduce 단계가 된다.
+    """
+    if not use_map_reduce(entries):
+        return f"뉴스 목록:\n{build_entry_block(entries, section)}"
+
+    chunks = chunk_entries(entries, MAP_CHUNK_SIZE, PROMPT_TOKEN_BUDGET)
+    with trace_span("map_reduce", section, chunks=len(chunks)):
+        executor = ThreadPoolExecutor(max_workers=max(1, MAP_WORKERS), thread_name_prefix="map")
+        futures = [submit_in_context(executor, digest_chunk, chunk) for chunk in chunks]
+        executor.shutdown(wait=False)
+        digests = [future.result() for future in futures]
+    logger.info("Map-reduce summarisation (%s): %d entries → %d chunks",
+                section, len(entries), len(chunks))
+    return "뉴스 묶음별 요약 (원문 링크 포함):\n" + "\n\n".join(digests)
+
+
+def summarize_news(entries: list[FeedEntry], on_text=None) -> str:
     if not entries:
         return "최근 24시간 이내 새로운 뉴스가 없습니다."
 
@@ -279,18 +1820,15 @@ def summarize_news(entries: list[str]) -> str:
 중요도 순서대로 정렬하고, 각 뉴스 사이에 빈 줄을 넣어주세요.
 전체 내용이 1800자를 넘기지 않도록 하고 최대한 채워주세요.
 
-뉴스 목록:
-{chr(10).join(entries)}"""
+{news_context(entries, "news")}"""
 
-    return safe_gemini(prompt, "뉴스 요약 생성 중 오류가 발생했습니다.")
+    fallback = "뉴스 요약 생성 중 오류가 발생했습니다."
+    return archive_summary(
+        "news", safe_gemini(prompt, fallback, GEMINI_CACHE_TTLS["news"], on_text), fallback
+    )
 
 
-def summarize_gaming_news(entries: list[str]) -> str:
-    """게임 뉴스 전용 요약 프롬프트."""
-    if not entries:
-        return "최근 24시간 이내 게임 뉴스가 없습니다."
-
-    prompt = f"""당신은 게임 업계 전문 에디터입니다.
+GAMING_NEWS_INSTRUCTIONS = """당신은 게임 업계 전문 에디터입니다.
 아래 게임 뉴스 목록을 보고, 게이머와 게임 개발자가 관심 가질 만한 핵심 뉴스를 정리해주세요.
 
 ## 🎮 오늘의 게임 뉴스
@@ -304,19 +1842,9 @@ def summarize_gaming_news(entries: list[str]) -> str:
 규칙:
 - 중요도/화제성 순으로 정렬
 - 게임 타이틀, 개발사, 플랫폼 등 구체적 정보를 반드시 포함
-- 전체 1800자 이내
-
-뉴스 목록:
-{chr(10).join(entries)}"""
-
-    return safe_gemini(prompt, "게임 뉴스 요약 생성 중 오류가 발생했습니다.")
+- 전체 1800자 이내"""
 
-
-def analyze_gaming_trends(entries: list[str]) -> str:
-    if not entries:
-        return "최근 게임 뉴스가 없어 트렌드 분석이 불가능합니다."
-
-    prompt = f"""당신은 게임 산업 애널리스트입니다.
+GAMING_TRENDS_INSTRUCTIONS = """당신은 게임 산업 애널리스트입니다.
 아래 게임 뉴스 목록을 분석하여 다음 정보를 제공해주세요:
 
 📈 **주요 트렌드** (3~5개)
@@ -325,26 +1853,66 @@ def analyze_gaming_trends(entries: list[str]) -> str:
 💹 **시장 동향 분석**
 💡 **게임 개발자가 참고할 점**
 
-전체 내용이 1800자를 넘기지 않도록 하고 최대한 채워주세요.
+전체 내용이 1800자를 넘기지 않도록 하고 최대한 채워주세요."""
 
-뉴스 목록:
-{chr(10).join(entries)}"""
 
-    return safe_gemini(prompt, "게임 트렌드 분석 중 오류가 발생했습니다.")
+def summarize_gaming_news(entries: list[FeedEntry], on_text=None) -> str:
+    """게임 뉴스 전용 요약 프롬프트."""
+    if not entries:
+        return "최근 24시간 이내 게임 뉴스가 없습니다."
+
+    prompt = f"""{GAMING_NEWS_INSTRUCTIONS}
+
+{news_context(entries, "gaming_news")}"""
+
+    fallback = "게임 뉴스 요약 생성 중 오류가 발생했습니다."
+    return archive_summary(
+        "gaming_news",
+        safe_gemini(prompt, fallback, GEMINI_CACHE_TTLS["gaming_news"], on_text),
+        fallback,
+    )
+
+
+def analyze_gaming_trends(entries: list[FeedEntry]) -> str:
+    if not entries:
+        return "최근 게임 뉴스가 없어 트렌드 분석이 불가능합니다."
+
+    prompt = f"""{GAMING_TRENDS_INSTRUCTIONS}
+
+{news_context(entries, "gaming_trends")}"""
+
+    fallback = "게임 트렌드 분석 중 오류가 발생했습니다."
+    return archive_summary(
+        "gaming_trends", safe_gemini(prompt, fallback, GEMINI_CACHE_TTLS["gaming_trends"]), fallback
+    )
+
+
+def summarize_gaming_batch(entries: list[FeedEntry]) -> dict[str, str] | None:
+    """게임 뉴스 요약 + 트렌드 분석을 한 번의 호출로 생성 (같은 뉴스 목록을 한 번만 전송)."""
+    if not entries:
+        return None
+    return batched_gemini(
+        {
+            "gaming_news": GAMING_NEWS_INSTRUCTIONS,
+            "gaming_trends": GAMING_TRENDS_INSTRUCTIONS,
+        },
+        context=news_context(entries, "gaming_news"),
+        ttl=min(GEMINI_CACHE_TTLS["gaming_news"], GEMINI_CACHE_TTLS["gaming_trends"]),
+    )
 
 
 # ═════════════════════════════════════════════════════════════════════════
 #  3) 데일리 브리핑 (인사 & 동기부여)
 # ═════════════════════════════════════════════════════════════════════════
 
-def build_daily_greeting_embed() -> dict:
-    """하루를 시작하는 인사 & 동기부여 메시지."""
-    now = datetime.now(TZ)
+def greeting_date_str(now: datetime) -> str:
     weekday_kr = ["월", "화", "수", "목", "금", "토", "일"][now.weekday()]
-    date_str = now.strftime(f"%Y년 %m월 %d일 ({weekday_kr})")
+    return now.strftime(f"%Y년 %m월 %d일 ({weekday_kr})")
 
-    # Gemini로 오늘의 명언 + 짧은 응원 메시지 생성
-    prompt = f"""오늘은 {date_str}입니다.
+
+def greeting_prompt(date_str: str) -> str:
+    """오늘의 명언 + 짧은 응원 메시지 생성 프롬프트."""
+    return f"""오늘은 {date_str}입니다.
 다음을 생성해주세요:
 
 1. 오늘의 명언 (실존 인물의 명언 1개, 한국어 번역 포함)
@@ -360,7 +1928,25 @@ def build_daily_greeting_embed() -> dict:
 
 전체 300자 이내로 작성해주세요."""
 
-    message = safe_gemini(prompt, "오늘도 좋은 하루 보내세요! 💪")
+
+def build_daily_greeting_embed(
+    message: str | None = None, on_text=None, now: datetime | None = None
+) -> dict:
+    """하루를 시작하는 인사 & 동기부여 메시지.
+
+    `message`가 주어지면(묶음 호출 결과 등) Gemini를 다시 호출하지 않는다.
+    `on_text`가 주어지면 스트리밍으로 생성한다. `now`로 다른 날짜용을 만들 수 있다.
+    """
+    date_str = greeting_date_str(now or datetime.now(TZ))
+
+    # Gemini로 오늘의 명언 + 짧은 응원 메시지 생성
+    if message is None:
+        message = safe_gemini(
+            greeting_prompt(date_str),
+            "오늘도 좋은 하루 보내세요! 💪",
+            GEMINI_CACHE_TTLS["greeting"],
+            on_text,
+        )
 
     return {
         "title": f"🌅 좋은 아침이에요! — {date_str}",
@@ -374,12 +1960,8 @@ def build_daily_greeting_embed() -> dict:
 #  4) 오늘의 일정 / 기념일 / 이슈 캘린더
 # ═════════════════════════════════════════════════════════════════════════
 
-def build_today_info_embed() -> dict:
-    """오늘 날짜 관련 기념일, IT/게임 업계 일정 정보."""
-    now = datetime.now(TZ)
-    date_str = now.strftime("%m월 %d일")
-
-    prompt = f"""오늘은 {now.strftime('%Y년 %m월 %d일')}입니다.
+def today_info_prompt(now: datetime) -> str:
+    return f"""오늘은 {now.strftime('%Y년 %m월 %d일')}입니다.
 다음 정보를 알려주세요:
 
 1. 📅 오늘의 기념일/국제일 (있다면, 1~2개)
@@ -389,7 +1971,21 @@ def build_today_info_embed() -> dict:
 없는 항목은 생략하세요.
 전체 500자 이내, 간결하게 작성해주세요."""
 
-    info = safe_gemini(prompt, f"{date_str} — 특별한 일정 정보가 없습니다.")
+
+def build_today_info_embed(info: str | None = None, now: datetime | None = None) -> dict:
+    """오늘 날짜 관련 기념일, IT/게임 업계 일정 정보.
+
+    `info`가 주어지면(묶음 호출 결과 등) Gemini를 다시 호출하지 않는다.
+    """
+    now = now or datetime.now(TZ)
+    date_str = now.strftime("%m월 %d일")
+
+    if info is None:
+        info = safe_gemini(
+            today_info_prompt(now),
+            f"{date_str} — 특별한 일정 정보가 없습니다.",
+            GEMINI_CACHE_TTLS["today_info"],
+        )
 
     return {
         "title": f"📅 오늘의 일정 & 기념일 — {date_str}",
@@ -399,6 +1995,125 @@ def build_today_info_embed() -> dict:
     }
 
 
+def generate_daily_batch(now: datetime | None = None) -> dict[str, str] | None:
+    """인사 메시지와 오늘의 일정을 한 번의 호출로 생성 (둘 다 날짜에만 의존)."""
+    now = now or datetime.now(TZ)
+    return batched_gemini(
+        {
+            "greeting": greeting_prompt(greeting_date_str(now)),
+            "today_info": today_info_prompt(now),
+        },
+        ttl=min(GEMINI_CACHE_TTLS["greeting"], GEMINI_CACHE_TTLS["today_info"]),
+    )
+
+
+# ─── 날짜 전용 섹션 미리 생성 ───────────────────────────────────────────
+DATE_ONLY_SECTIONS = ("greeting", "today_info")
+
+
+class PrecomputeStore:
+    """날짜에만 의존하는 섹션 embed를 (날짜, 섹션) 단위로 보관.
+
+    기본은 메모리이고, `path`가 주어지면 SQLite에 기록해 다른 인스턴스나
+    재시작 후에도 읽을 수 있다. 항목마다 만료 시각을 가진다.
+    """
+
+    def __init__(self, path: str | None = None):
+        self._mem = {}  # (date, section) -> (expires_at, embed_json)
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            self._db = LazySqlite(
+                path,
+                "CREATE TABLE IF NOT EXISTS precomputed_embeds ("
+                " date TEXT NOT NULL, section TEXT NOT NULL, embed TEXT NOT NULL,"
+                " expires_at REAL NOT NULL, PRIMARY KEY (date, section));",
+            )
+
+    def get(self, date, section: str) -> dict | None:
+        key = (str(date), section)
+        now = time.time()
+        with self._lock:
+            item = self._mem.get(key)
+            if item is None and self._db is not None:
+                item = self._db.conn.execute(
+                    "SELECT expires_at, embed FROM precomputed_embeds WHERE date = ? AND section = ?",
+                    key,
+                ).fetchone()
+            if item and item[0] > now:
+                return json.loads(item[1])  # 호출 측이 고쳐도 보관본은 그대로
+        return None
+
+    def put(self, date, section: str, embed: dict, ttl: float = PRECOMPUTE_TTL) -> None:
+        key = (str(date), section)
+        now = time.time()
+        item = (now + ttl, json.dumps(embed, ensure_ascii=False))
+        with self._lock:
+            self._mem = {k: v for k, v in self._mem.items() if v[0] > now}
+            self._mem[key] = item
+            if self._db is not None:
+                self._db.conn.execute(
+                    "INSERT OR REPLACE INTO precomputed_embeds (date, section, embed, expires_at)"
+                    " VALUES (?, ?, ?, ?)",
+                    (*key, item[1], item[0]),
+                )
+                self._db.conn.execute("DELETE FROM precomputed_embeds WHERE expires_at <= ?", (now,))
+                self._db.conn.commit()
+
+
+precompute_store = PrecomputeStore(PRECOMPUTE_PATH)
+
+
+def load_precomputed_sections(now: datetime | None = None) -> dict[str, dict]:
+    """오늘 날짜로 미리 생성해 둔 섹션 embed (없거나 만료된 섹션은 빠진다)."""
+    today = (now or datetime.now(TZ)).date()
+    found = {}
+    for section in DATE_ONLY_SECTIONS:
+        embed = precompute_store.get(today, section)
+        metrics.inc("ai_secretary_precompute_lookups_total", 1,
+                    "Precomputed section lookups", section=section,
+                    result="hit" if embed else "miss")
+        if embed:
+            found[section] = embed
+    if found:
+        logger.info("Using precomputed sections for %s: %s", today, ", ".join(found))
+    return found
+
+
+def precompute_daily_sections(day=None) -> dict:
+    """인사와 오늘의 일정을 `day`(기본: 내일) 날짜로 미리 생성해 저장한다.
+
+    생성에 실패한 섹션은 저장하지 않으므로 당일 실행에서 다시 생성된다.
+    """
+    if day is None:
+        day = (datetime.now(TZ) + timedelta(days=1)).date()
+    target = TZ.localize(datetime(day.year, day.month, day.day))
+
+    batch = generate_daily_batch(target) if GEMINI_BATCH_MODE else None
+    prompts = {
+        "greeting": greeting_prompt(greeting_date_str(target)),
+        "today_info": today_info_prompt(target),
+    }
+    builders = {
+        "greeting": lambda text: build_daily_greeting_embed(text, now=target),
+        "today_info": lambda text: build_today_info_embed(text, now=target),
+    }
+
+    results = {}
+    for section in DATE_ONLY_SECTIONS:
+        try:
+            text = (batch or {}).get(section) or gemini_generate(
+                prompts[section], GEMINI_CACHE_TTLS[section]
+            )
+            precompute_store.put(day, section, builders[section](text))
+            results[section] = "stored"
+        except Exception as e:
+            logger.error("Precompute %s for %s failed: %s", section, day, e)
+            results[section] = f"failed: {e}"
+    logger.info("Precomputed sections for %s: %s", day, results)
+    return {"date": day.isoformat(), "sections": results}
+
+
 # ═════════════════════════════════════════════════════════════════════════
 #  5) Embed 빌더
 # ═════════════════════════════════════════════════════════════════════════
@@ -434,101 +2149,1390 @@ def build_gaming_trends_embed(analysis: str) -> dict:
 #  6) 디스코드 전송
 # ═════════════════════════════════════════════════════════════════════════
 
-def send_to_discord(embeds: list[dict]):
+def embed_char_count(embed: dict) -> int:
+    """Discord가 6000자 한도에 포함하는 embed 텍스트 길이."""
+    total = len(embed.get("title", "")) + len(embed.get("description", ""))
+    total += len(embed.get("footer", {}).get("text", ""))
+    total += len(embed.get("author", {}).get("name", ""))
+    for embed_field in embed.get("fields", []):
+        total += len(embed_field.get("name", "")) + len(embed_field.get("value", ""))
+    return total
+
+
+def pack_embeds(embeds: list[dict]) -> list[list[dict]]:
+    """순서를 유지하며 embed를 메시지 단위로 묶는다 (최대 10개, 합계 6000자 이하)."""
+    batches, current, chars = [], [], 0
     for embed in embeds:
+        size = embed_char_count(embed)
+        if current and (
+            len(current) >= DISCORD_MAX_EMBEDS or chars + size > DISCORD_MESSAGE_CHAR_LIMIT
+        ):
+            batches.append(current)
+            current, chars = [], 0
+        current.append(embed)
+        chars += size
+    if current:
+        batches.append(current)
+    return batches
+
+
+class DiscordSender:
+    """Discord 웹훅 전송기.
+
+    하나의 세션으로 연결을 재사용하고, `X-RateLimit-*` 헤더로 버킷 상태를 추적해
+    한도가 소진되면 보내기 전에 기다린다. 429나 일시적 오류는 `budget`(초) 안에서 재시도한다.
+    """
+
+    def __init__(self, webhook_url: str, budget: float = DISCORD_SEND_BUDGET, name: str = "discord"):
+        self.webhook_url = webhook_url
+        self.budget = budget
+        self.name = name  # 서킷 브레이커 대상 이름 (웹훅별로 따로 끊긴다)
+        self._lock = threading.Lock()
+        self._route_buckets = {}  # "METHOD url" -> 버킷 ID
+        self._buckets = {}        # 버킷 ID -> (remaining, reset_at[monotonic])
+        self._global_reset_at = 0.0
+
+    def send(self, embeds: list[dict]) -> list[dict]:
+        """embed를 묶어서 순서대로 전송한다. 끝내 전송하지 못한 embed 목록을 반환."""
+        deadline = time.monotonic() + self.budget
+        failed = []
+        for batch in pack_embeds(embeds):
+            if self._deliver(batch, deadline):
+                continue
+            if len(batch) > 1:
+                # 묶음 전체가 거부되었다면 문제 embed만 걸러내도록 하나씩 다시 시도
+                failed.extend(e for e in batch if not self._deliver([e], deadline))
+            else:
+                failed.extend(batch)
+        return failed
+
+    def post_message(self, embeds: list[dict]) -> str | None:
+        """`?wait=true`로 메시지를 보내고 메시지 ID를 반환 (실패 시 None)."""
+        deadline = time.monotonic() + self.budget
+        r = self._request("POST", self.webhook_url, embeds, deadline, params={"wait": "true"})
+        if r is None:
+            return None
         try:
-            r = requests.post(
-                DISCORD_WEBHOOK, json={"embeds": [embed]}, timeout=10
-            )
-            r.raise_for_status()
-            logger.info("Discord embed sent: %s", embed.get("title", "untitled"))
+            return str(r.json()["id"])
+        except (ValueError, KeyError) as e:
+            logger.error("Discord message id missing in response: %s", e)
+            return None
+
+    def edit_message(self, message_id: str, embeds: list[dict]) -> bool:
+        """웹훅으로 보낸 메시지의 embed를 제자리에서 수정 (PATCH)."""
+        base, sep, query = self.webhook_url.partition("?")
+        url = f"{base}/messages/{message_id}{sep}{query}"
+        deadline = time.monotonic() + self.budget
+        return self._request("PATCH", url, embeds, deadline) is not None
+
+    def _deliver(self, batch: list[dict], deadline: float) -> bool:
+        return self._request("POST", self.webhook_url, batch, deadline) is not None
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        embeds: list[dict],
+        deadline: float,
+        params: dict | None = None,
+    ) -> requests.Response | None:
+        """레이트 리밋을 지키며 요청하고, 성공 응답을 반환한다 (예산 내 실패 시 None)."""
+        route = f"{method} {url}"
+        titles = ", ".join(e.get("title", "untitled") for e in embeds)
+        breaker = get_breaker(self.name)
+        if not breaker.allow():
+            logger.error("Discord circuit open, skipping send: %s", titles)
+            return None
+        attempt = 0
+        while True:
+            if not self._wait_for_capacity(route, deadline):
+                logger.error("Discord send budget exhausted while rate limited: %s", titles)
+                breaker.record_success()  # 레이트 리밋은 장애가 아님 (half-open 시험 호출 해제)
+                return None
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.error("Discord send failed within budget: %s", titles)
+                breaker.record_failure(TimeoutError("send budget exhausted"))
+                return None
+            try:
+                with trace_span("discord_send", method, embeds=len(embeds)) as span:
+                    r = get_http_session().request(
+                        method, url, params=params, json={"embeds": embeds},
+                        timeout=min(10, remaining),
+                    )
+                    span["status"] = r.status_code
+                    span["bytes"] = len(r.request.body or b"")
+            except requests.RequestException as e:
+                logger.warning("Discord send error (attempt %d): %s", attempt + 1, e)
+                error = e
+            else:
+                self._record_limits(route, r)
+                if r.status_code < 500:
+                    breaker.record_success()  # 응답이 왔으면 서비스는 살아 있음
+                if r.ok:
+                    if method == "POST":
+                        logger.info("Discord embeds sent (%d): %s", len(embeds), titles)
+                    return r
+                if r.status_code == 429:
+                    self._record_retry_after(route, r)
+                    logger.warning("Discord rate limited, retry scheduled: %s", titles)
+                    continue
+                if r.status_code < 500:
+                    logger.error("Discord send rejected (%d): %s", r.status_code, r.text[:200])
+                    return None
+                logger.warning("Discord send error (attempt %d): HTTP %d", attempt + 1, r.status_code)
+                error = RuntimeError(f"HTTP {r.status_code}")
+
+            backoff = random.uniform(0, min(0.5 * 2 ** attempt, 8.0))  # full jitter
+            attempt += 1
+            if time.monotonic() + backoff >= deadline:
+                logger.error("Discord send failed within budget: %s", titles)
+                breaker.record_failure(error)
+                return None
+            time.sleep(backoff)
+
+    def _wait_for_capacity(self, route: str, deadline: float) -> bool:
+        with self._lock:
+            reset_at = self._global_reset_at
+            bucket = self._route_buckets.get(route, route)
+            remaining, bucket_reset_at = self._buckets.get(bucket, (1, 0.0))
+            if remaining <= 0:
+                reset_at = max(reset_at, bucket_reset_at)
+
+        delay = reset_at - time.monotonic()
+        if delay <= 0:
+            return True
+        if time.monotonic() + delay >= deadline:
+            return False
+        logger.info("Waiting %.2fs for Discord rate limit reset", delay)
+        time.sleep(delay)
+        return True
+
+    def _record_limits(self, route: str, r: requests.Response) -> None:
+        bucket = r.headers.get("X-RateLimit-Bucket") or route
+        remaining = r.headers.get("X-RateLimit-Remaining")
+        reset_after = r.headers.get("X-RateLimit-Reset-After")
+        with self._lock:
+            self._route_buckets[route] = bucket
+            if remaining is not None and reset_after is not None:
+                self._buckets[bucket] = (
+                    int(remaining), time.monotonic() + float(reset_after)
+                )
+
+    def _record_retry_after(self, route: str, r: requests.Response) -> None:
+        try:
+            body = r.json()
+        except ValueError:
+            body = {}
+        retry_after = float(body.get("retry_after") or r.headers.get("Retry-After") or 1.0)
+        reset_at = time.monotonic() + retry_after
+        with self._lock:
+            if body.get("global") or r.headers.get("X-RateLimit-Global"):
+                self._global_reset_at = max(self._global_reset_at, reset_at)
+            else:
+                bucket = self._route_buckets.get(route, route)
+                self._buckets[bucket] = (0, reset_at)
+
+
+def send_to_discord(embeds: list[dict], sender: DiscordSender | None = None) -> list[dict]:
+    """embed 목록을 전송하고, 전송에 실패한 embed 목록을 반환한다 (기본: 첫 구독의 웹훅)."""
+    sender = sender or subscriptions[0].sender
+    failed = sender.send(embeds)
+    if failed:
+        logger.error("Discord send failed for %d embed(s) (%s)", len(failed), sender.name)
+    return failed
+
+
+# ═════════════════════════════════════════════════════════════════════════
+#  7) 섹션 실행기 (의존성 그래프)
+# ═════════════════════════════════════════════════════════════════════════
+
+class SectionGraph:
+    """의존성이 선언된 섹션 작업들을 스레드 풀에서 병렬로 실행한다.
+
+    작업은 의존 대상보다 나중에 등록해야 한다(위상 순서). 풀의 작업 큐는 FIFO이므로
+    의존 작업이 항상 먼저 워커를 잡고, 뒤의 작업은 그 결과를 기다리기만 하면 된다.
+    의존 작업이 실패하면 뒤따르는 작업도 같은 예외로 실패한다.
+    """
+
+    def __init__(self, max_workers: int = SECTION_WORKERS, listener=None):
+        self._max_workers = max(1, max_workers)
+        self._listener = listener  # listener(name, status, error=None): 진행 상황 통지
+        self._tasks = {}    # name -> (fn, deps)
+        self._finishers = {}  # name -> 성공/실패(의존 작업 실패 포함)와 관계없이 끝나면 호출
+        self._futures = {}  # name -> Future
+
+    def add(self, name: str, fn, deps: tuple = (), on_finish=None) -> None:
+        if name in self._tasks:
+            raise ValueError(f"Duplicate section task: {name}")
+        unknown = [d for d in deps if d not in self._tasks]
+        if unknown:
+            raise ValueError(f"Section task {name} depends on unknown tasks: {unknown}")
+        self._tasks[name] = (fn, tuple(deps))
+        if on_finish is not None:
+            self._finishers[name] = on_finish
+
+    def required(self, targets) -> set:
+        """`targets`와 그 의존 작업 전체(추이적)의 이름 집합."""
+        needed, stack = set(), list(targets)
+        while stack:
+            name = stack.pop()
+            if name not in needed:
+                needed.add(name)
+                stack.extend(self._tasks[name][1])
+        return needed
+
+    def start(self, targets=None) -> "SectionGraph":
+        """작업을 실행한다. `targets`가 주어지면 그 작업과 의존 작업만 실행한다."""
+        needed = self.required(targets) if targets is not None else set(self._tasks)
+        executor = ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="section"
+        )
+        for name, (fn, deps) in self._tasks.items():
+            if name not in needed:
+                continue
+            self._notify(name, "pending")
+            self._futures[name] = submit_in_context(executor, self._run, name, fn, deps)
+        executor.shutdown(wait=False)
+        return self
+
+    def _run(self, name: str, fn, deps: tuple):
+        try:
+            args = [self._futures[d].result() for d in deps]
+            self._notify(name, "running")
+            result = fn(*args)
         except Exception as e:
-            logger.error("Discord send error: %s", e)
+            self._notify(name, "failed", e)
+            raise
+        finally:
+            finisher = self._finishers.get(name)
+            if finisher is not None:
+                finisher()
+        self._notify(name, "done")
+        return result
+
+    def _notify(self, name: str, status: str, error: Exception | None = None) -> None:
+        if self._listener is None:
+            return
+        try:
+            self._listener(name, status, error)
+        except Exception as e:
+            logger.warning("Section listener error (%s): %s", name, e)
+
+    def done(self, name: str) -> bool:
+        future = self._futures.get(name)
+        return future is None or future.done()
+
+    def result(self, name: str):
+        """작업이 끝날 때까지 기다려 결과를 반환한다. 실패했다면 예외를 다시 던진다."""
+        return self._futures[name].result()
+
+
+class StreamBuffer:
+    """스트리밍 중인 섹션의 중간 텍스트. 전송 루프가 이를 보고 메시지를 점진적으로 수정한다."""
+
+    CURSOR = " ▌"
+
+    def __init__(self, build):
+        self._build = build  # 텍스트 -> embed
+        self._cond = threading.Condition()
+        self.text = ""
+        self.version = 0
+        self.closed = False
+
+    def update(self, text: str) -> None:
+        with self._cond:
+            self.text = text
+            self.version += 1
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+    def wait_for_text(self, timeout: float) -> bool:
+        """첫 조각이 도착하거나 스트림이 끝날 때까지 최대 `timeout`초 대기."""
+        with self._cond:
+            return bool(self._cond.wait_for(lambda: self.text or self.closed, timeout))
+
+    def wait_closed(self, timeout: float) -> bool:
+        with self._cond:
+            return self._cond.wait_for(lambda: self.closed, timeout)
+
+    def partial_embed(self) -> tuple[int, dict]:
+        with self._cond:
+            version, text = self.version, self.text
+        return version, self._build(text + self.CURSOR)
+
+    def last_embed(self) -> dict:
+        """지금까지 받은 텍스트로 만든 embed (커서 없음). 생성이 중간에 실패했을 때 쓴다."""
+        with self._cond:
+            text = self.text
+        return self._build(text)
+
+
+# Discord 전송 순서 (섹션 이름, errors 라벨)
+SECTION_ORDER = [
+    ("greeting", "greeting"),
+    ("today_info", "today_info"),
+    ("weather", "weather"),
+    ("news", "news"),
+    ("gaming_news", "gaming"),
+    ("gaming_trends", "gaming"),
+]
+ALL_SECTIONS = tuple(section for section, _ in SECTION_ORDER)
+
+
+@dataclass
+class Subscription:
+    """웹훅 1개가 받을 섹션과 날씨 도시. 같은 입력의 섹션은 구독이 여럿이어도 한 번만 생성한다."""
+
+    name: str
+    webhook: str
+    city: str = CITY
+    sections: tuple[str, ...] = ALL_SECTIONS
+    sender: DiscordSender = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.sender = DiscordSender(
+            self.webhook, name="discord" if self.name == "default" else f"discord:{self.name}"
+        )
+
+    def state_key(self, section: str) -> str:
+        """실행 상태 저장소의 섹션 키 (기본 구독은 기존과 같은 섹션 이름)."""
+        return section if self.name == "default" else f"{self.name}:{section}"
+
+    def node(self, section: str) -> str:
+        """이 섹션을 만드는 그래프 노드 (날씨만 도시별로 다르다)."""
+        return weather_node(self.city) if section == "weather" else section
+
+
+def weather_node(city: str) -> str:
+    return "weather" if city == CITY else f"weather:{city}"
+
+
+def load_subscriptions() -> list[Subscription]:
+    """`SUBSCRIPTIONS`(JSON) 또는 `SUBSCRIPTIONS_PATH` 파일에서 구독 목록을 읽는다.
+
+    형식: `[{"name": "team-a", "webhook": "https://...", "city": "Busan,KR",
+    "sections": ["greeting", "weather"]}, ...]` (city/sections 생략 시 기본값).
+    설정이 없으면 `DISCORD_WEBHOOK_URL` + `CITY_NAME` 단일 구독.
+    """
+    raw = SUBSCRIPTIONS_JSON
+    if SUBSCRIPTIONS_PATH:
+        with open(SUBSCRIPTIONS_PATH, encoding="utf-8") as f:
+            raw = f.read()
+    if not raw:
+        return [Subscription("default", DISCORD_WEBHOOK)]
+
+    subs = []
+    for i, item in enumerate(json.loads(raw)):
+        sections = tuple(item.get("sections") or ALL_SECTIONS)
+        unknown = set(sections) - set(ALL_SECTIONS)
+        if unknown:
+            raise ValueError(f"unknown sections {sorted(unknown)} in subscription {i}")
+        subs.append(Subscription(
+            name=item.get("name") or f"sub{i + 1}",
+            webhook=item["webhook"],
+            city=item.get("city") or CITY,
+            sections=sections,
+        ))
+    names = [sub.name for sub in subs]
+    if not subs or len(set(names)) != len(names):
+        raise ValueError("subscriptions must be a non-empty list with unique names")
+    return subs
+
+
+try:
+    subscriptions = load_subscriptions()
+except (OSError, ValueError, KeyError, TypeError) as e:
+    logger.critical("Invalid subscriptions config: %s", e)
+    sys.exit(1)
+if len(subscriptions) > 1 or subscriptions[0].name != "default":
+    logger.info("Subscriptions: %s", ", ".join(
+        f"{sub.name}({sub.city}, {len(sub.sections)} sections)" for sub in subscriptions
+    ))
+
+
+def all_targets() -> list[str]:
+    """모든 구독의 (구독, 섹션) 실행 상태 키."""
+    return [sub.state_key(s) for sub in subscriptions for s in ALL_SECTIONS if s in sub.sections]
+
+
+def delivery_plan(targets) -> list[tuple[Subscription, list[tuple[str, str]]]]:
+    """구독별로 이번 실행에서 보낼 (섹션, errors 라벨) 목록 (전송 순서대로)."""
+    targets = set(targets)
+    plan = []
+    for sub in subscriptions:
+        items = [
+            (section, label) for section, label in SECTION_ORDER
+            if section in sub.sections and sub.state_key(section) in targets
+        ]
+        if items:
+            plan.append((sub, items))
+    return plan
+
+
+# 섹션 → 마지막 브리핑 이후 엔트리만 모을 때 쓰는 피드 저장소 표식 이름
+BRIEFING_MARKS = {"news": "news", "gaming_news": "gaming"}
+
+
+def _briefing_since(name: str) -> datetime | None:
+    if feed_store is None or not FEED_SINCE_LAST_BRIEFING:
+        return None
+    return feed_store.last_briefing(name)
+
+
+def _collect_news() -> list[FeedEntry]:
+    entries = collect_entries(NEWS_RSS_URLS, since=_briefing_since("news"))
+    logger.info("News entries collected: %d", len(entries))
+    archive_entries("news", entries)
+    return entries
+
+
+def _collect_gaming_news() -> list[FeedEntry]:
+    entries = collect_entries(GAMING_RSS_URLS, since=_briefing_since("gaming"))
+    logger.info("Gaming entries collected: %d", len(entries))
+    archive_entries("gaming", entries)
+    return entries
+
+
+def _gaming_section(entries: list[FeedEntry], batch: dict | None, key: str, summarize, build):
+    if not entries:
+        return None
+    text = archive_summary(key, batch[key]) if batch else summarize(entries)
+    return build(text)
+
+
+def build_section_graph(listener=None, stream: bool = False, cities=(CITY,)) -> SectionGraph:
+    """브리핑 섹션 그래프 구성. 게임 요약과 트렌드 분석은 같은 수집 결과를 공유한다.
+
+    `GEMINI_BATCH_MODE`이면 인사/일정, 게임 요약/트렌드를 각각 한 번의 호출로 묶고,
+    묶음 응답을 쓸 수 없으면 각 섹션이 개별 호출로 폴백한다.
+    `stream`이면 인사/뉴스/게임 뉴스를 스트리밍으로 생성하고 `graph.streams`에
+    섹션별 `StreamBuffer`를 노출한다 (스트리밍 섹션은 묶음 호출에서 빠진다).
+    미리 생성해 둔 인사/일정 embed가 있으면 Gemini를 호출하지 않고 그대로 쓴다.
+    날씨는 `cities`의 도시마다 노드 하나씩 (`weather_node`) 만든다.
+    """
+    graph = SectionGraph(listener=listener)
+    precomputed = load_precomputed_sections()
+    graph.streams = {}
+    if stream:
+        graph.streams = {
+            "greeting": StreamBuffer(lambda text: build_daily_greeting_embed(text)),
+            "news": StreamBuffer(build_news_embed),
+            "gaming_news": StreamBuffer(build_gaming_news_embed),
+        }
+        if "greeting" in precomputed:
+            del graph.streams["greeting"]
+    streams = graph.streams
+
+    for section, embed in precomputed.items():
+        graph.add(section, lambda embed=embed: embed)
+    if "greeting" in streams:
+        graph.add(
+            "greeting",
+            lambda: build_daily_greeting_embed(None, streams["greeting"].update),
+            on_finish=streams["greeting"].close,
+        )
+        if "today_info" not in precomputed:
+            graph.add("today_info", build_today_info_embed)
+    elif precomputed:
+        # 하나만 미리 생성돼 있으면 나머지 하나는 개별 호출로 생성
+        if "greeting" not in precomputed:
+            graph.add("greeting", build_daily_greeting_embed)
+        if "today_info" not in precomputed:
+            graph.add("today_info", build_today_info_embed)
+    elif GEMINI_BATCH_MODE:
+        graph.add("daily_batch", generate_daily_batch)
+        graph.add(
+            "greeting",
+            lambda batch: build_daily_greeting_embed((batch or {}).get("greeting")),
+            deps=("daily_batch",),
+        )
+        graph.add(
+            "today_info",
+            lambda batch: build_today_info_embed((batch or {}).get("today_info")),
+            deps=("daily_batch",),
+        )
+    else:
+        graph.add("greeting", build_daily_greeting_embed)
+        graph.add("today_info", build_today_info_embed)
+    for city in cities:
+        graph.add(weather_node(city), lambda city=city: build_weather_embed(fetch_weather(city), city))
+    graph.add("news_entries", _collect_news)
+    if "news" in streams:
+        graph.add(
+            "news",
+            lambda entries: build_news_embed(summarize_news(entries, streams["news"].update)),
+            deps=("news_entries",),
+            on_finish=streams["news"].close,
+        )
+    else:
+        graph.add(
+            "news",
+            lambda entries: build_news_embed(summarize_news(entries)),
+            deps=("news_entries",),
+        )
+    graph.add("gaming_entries", _collect_gaming_news)
+    if "gaming_news" in streams:
+        graph.add("gaming_batch", lambda entries: None, deps=("gaming_entries",))
+        graph.add(
+            "gaming_news",
+            lambda entries: _gaming_section(
+                entries,
+                None,
+                "gaming_news",
+                lambda e: summarize_gaming_news(e, streams["gaming_news"].update),
+                build_gaming_news_embed,
+            ),
+            deps=("gaming_entries",),
+            on_finish=streams["gaming_news"].close,
+        )
+    else:
+        graph.add(
+            "gaming_batch",
+            lambda entries: summarize_gaming_batch(entries) if GEMINI_BATCH_MODE else None,
+            deps=("gaming_entries",),
+        )
+        graph.add(
+            "gaming_news",
+            lambda entries, batch: _gaming_section(
+                entries, batch, "gaming_news", summarize_gaming_news, build_gaming_news_embed
+            ),
+            deps=("gaming_entries", "gaming_batch"),
+        )
+    graph.add(
+        "gaming_trends",
+        lambda entries, batch: _gaming_section(
+            entries, batch, "gaming_trends", analyze_gaming_trends, build_gaming_trends_embed
+        ),
+        deps=("gaming_entries", "gaming_batch"),
+    )
+    return graph
 
 
 # ═════════════════════════════════════════════════════════════════════════
-#  라우트
+#  8) 실행 상태 저장소 (날짜별 섹션 완료 기록 + 실행 임대)
 # ═════════════════════════════════════════════════════════════════════════
 
-@app.route("/health", methods=["GET"])
-def health():
-    """헬스체크 엔드포인트 (Cloud Run / 로드밸런서용)."""
-    return jsonify(status="healthy", timestamp=datetime.now(TZ).isoformat()), 200
+INSTANCE_ID = f"{socket.gethostname()}-{os.getpid()}"
+
+
+class RunStateStore:
+    """날짜별로 어떤 섹션이 전송을 마쳤는지 기록하고, 한 번에 한 실행만 돌도록 임대를 건다.
+
+    기본 구현은 메모리 기반(컨테이너 수명 동안 유지)이며, 여러 인스턴스가 공유해야
+    하면 `SqliteRunStateStore`를 사용한다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._leases = {}    # date -> (owner, expires_at)
+        self._sections = {}  # date -> {section: status}
+
+    def acquire_lease(self, date, owner: str, ttl: float = RUN_LEASE_TTL) -> bool:
+        now = time.time()
+        with self._lock:
+            holder = self._leases.get(str(date))
+            if holder and holder[0] != owner and holder[1] > now:
+                return False
+            self._leases[str(date)] = (owner, now + ttl)
+            return True
+
+    def release_lease(self, date, owner: str) -> None:
+        with self._lock:
+            holder = self._leases.get(str(date))
+            if holder and holder[0] == owner:
+                del self._leases[str(date)]
+
+    def section_states(self, date) -> dict[str, str]:
+        with self._lock:
+            return dict(self._sections.get(str(date), {}))
+
+    def mark_section(self, date, section: str, status: str) -> None:
+        with self._lock:
+            self._sections.setdefault(str(date), {})[section] = status
+
+    def save_run(self, run_id: str, record: dict) -> None:
+        """`/runs` 조회용 실행 기록 저장 (메모리 저장소는 프로세스 안의 `_runs`로 충분)."""
+
+    def load_run(self, run_id: str) -> dict | None:
+        return None
+
+
+class SqliteRunStateStore(RunStateStore):
+    """SQLite 파일 기반 실행 상태 저장소 (공유 볼륨에 두면 인스턴스/재시작 간 공유).
+
+    임대는 SQLite 파일 잠금(`BEGIN IMMEDIATE`)에 의존한다. 여러 호스트가 공유하려면
+    WAL 대신 롤백 저널(DELETE)을 쓰고, 볼륨이 POSIX 잠금(fcntl)을 제대로 지원해야 한다
+    (NFS 등 잠금이 무시되는 파일시스템에서는 같은 호스트 안에서만 안전).
+    """
+
+    def __init__(self, path: str):
+        super().__init__()
+        self._db = LazySqlite(
+            path,
+            "CREATE TABLE IF NOT EXISTS run_leases ("
+            " date TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS run_sections ("
+            " date TEXT NOT NULL, section TEXT NOT NULL, status TEXT NOT NULL,"
+            " updated_at REAL NOT NULL, PRIMARY KEY (date, section));"
+            "CREATE TABLE IF NOT EXISTS run_records ("
+            " run_id TEXT PRIMARY KEY, record TEXT NOT NULL, created_at REAL NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS idx_run_records_created ON run_records (created_at);",
+            journal_mode="DELETE",
+        )
+
+    def acquire_lease(self, date, owner: str, ttl: float = RUN_LEASE_TTL) -> bool:
+        now = time.time()
+        with self._lock:
+            try:
+                # BEGIN IMMEDIATE로 쓰기 잠금을 먼저 잡아 다른 프로세스와의 경합을 막는다
+                self._db.conn.execute("BEGIN IMMEDIATE")
+                row = self._db.conn.execute(
+                    "SELECT owner, expires_at FROM run_leases WHERE date = ?", (str(date),)
+                ).fetchone()
+                if row and row[0] != owner and row[1] > now:
+                    self._db.conn.execute("ROLLBACK")
+                    return False
+                self._db.conn.execute(
+                    "INSERT OR REPLACE INTO run_leases (date, owner, expires_at) VALUES (?, ?, ?)",
+                    (str(date), owner, now + ttl),
+                )
+                self._db.conn.execute("COMMIT")
+                return True
+            except Exception:
+                if self._db.conn.in_transaction:
+                    self._db.conn.execute("ROLLBACK")
+                raise
+
+    def release_lease(self, date, owner: str) -> None:
+        with self._lock:
+            self._db.conn.execute(
+                "DELETE FROM run_leases WHERE date = ? AND owner = ?", (str(date), owner)
+            )
+            self._db.conn.commit()
+
+    def section_states(self, date) -> dict[str, str]:
+        with self._lock:
+            rows = self._db.conn.execute(
+                "SELECT section, status FROM run_sections WHERE date = ?", (str(date),)
+            ).fetchall()
+        return dict(rows)
+
+    def mark_section(self, date, section: str, status: str) -> None:
+        with self._lock:
+            self._db.conn.execute(
+                "INSERT OR REPLACE INTO run_sections (date, section, status, updated_at)"
+                " VALUES (?, ?, ?, ?)",
+                (str(date), section, status, time.time()),
+            )
+            self._db.conn.commit()
+
+    def save_run(self, run_id: str, record: dict) -> None:
+        with self._lock:
+            conn = self._db.conn
+            conn.execute(
+                "INSERT INTO run_records (run_id, record, created_at) VALUES (?, ?, ?)"
+                " ON CONFLICT(run_id) DO UPDATE SET record = excluded.record",
+                (run_id, json.dumps(record, ensure_ascii=False), time.time()),
+            )
+            conn.execute(
+                "DELETE FROM run_records WHERE run_id NOT IN"
+                " (SELECT run_id FROM run_records ORDER BY created_at DESC LIMIT ?)",
+                (RUN_HISTORY_LIMIT,),
+            )
+            conn.commit()
 
+    def load_run(self, run_id: str) -> dict | None:
+        with self._lock:
+            row = self._db.conn.execute(
+                "SELECT record FROM run_records WHERE run_id = ?", (run_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
 
-@app.route("/", methods=["GET"])
-def handler():
-    global _last_run_date
 
-    # ── 인증 토큰 검증 (설정된 경우) ──
-    if AUTH_TOKEN and request.args.get("token") != AUTH_TOKEN:
-        logger.warning("Unauthorized access attempt from %s", request.remote_addr)
-        return jsonify(error="unauthorized"), 401
+def create_run_state_store() -> RunStateStore:
+    if RUN_STATE_PATH:
+        logger.info("Using SQLite run state store: %s", RUN_STATE_PATH)
+        return SqliteRunStateStore(RUN_STATE_PATH)
+    return RunStateStore()
 
-    # ── 같은 날 중복 실행 방지 (선택적) ──
-    today = datetime.now(TZ).date()
-    force = request.args.get("force", "").lower() == "true"
-    if _last_run_date == today and not force:
-        logger.info("Already ran today (%s). Skipping. Use ?force=true to override.", today)
-        return jsonify(status="already_ran", date=str(today)), 200
-    _last_run_date = today
 
-    errors = []
+run_state = create_run_state_store()
 
-    # ── 1. 데일리 인사 ──
-    try:
-        greeting = build_daily_greeting_embed()
-        send_to_discord([greeting])
-    except Exception as e:
-        logger.error("Greeting error: %s", e)
-        errors.append(f"greeting: {e}")
 
-    # ── 2. 오늘의 일정/기념일 ──
+def sections_to_run(date, force: str) -> list[str]:
+    """이번 실행에서 돌릴 섹션 목록 (구독별 실행 상태 키).
+
+    - 기본 / `force=true`: 아직 완료되지 않았거나 실패한 섹션만
+    - `force=true`인데 모두 완료된 상태거나 `force=all`: 전체 섹션
+    """
+    all_sections = all_targets()
+    if force == "all":
+        return all_sections
+    states = run_state.section_states(date)
+    missing = [s for s in all_sections if states.get(s) != "done"]
+    if not missing and force == "true":
+        return all_sections
+    return missing
+
+
+# ═════════════════════════════════════════════════════════════════════════
+#  9) 브리핑 실행 & 실행 기록
+# ═════════════════════════════════════════════════════════════════════════
+
+class BriefingRun:
+    """브리핑 1회 실행의 상태 기록 (섹션별 진행 상황/소요 시간, 최종 errors)."""
+
+    def __init__(self, date, targets: list[str] | None = None, stream: bool = False):
+        self.id = uuid.uuid4().hex
+        self.date = date
+        self.targets = targets if targets is not None else all_targets()
+        self.stream = stream
+        self.status = "queued"
+        self.errors = []
+        self.created_at = datetime.now(TZ)
+        self.started_at = None
+        self.finished_at = None
+        self.sections = {}
+        self.spans = []  # trace_span 기록 (outbound 호출별 소요 시간/크기)
+        self._lock = threading.Lock()
+
+    def update_section(self, name: str, status: str, error: Exception | None = None) -> None:
+        now = time.monotonic()
+        with self._lock:
+            info = self.sections.setdefault(name, {"status": "pending"})
+            info["status"] = status
+            if status == "running":
+                info["_started"] = now
+            elif status in ("done", "failed") and "_started" in info:
+                info["duration_ms"] = round((now - info["_started"]) * 1000, 1)
+            if error is not None:
+                info["error"] = str(error)
+        if status in ("done", "failed"):
+            self.save()
+
+    def save(self) -> None:
+        """현재 상태를 실행 상태 저장소에 기록 (다른 워커/인스턴스의 `/runs` 조회용)."""
+        try:
+            run_state.save_run(self.id, self.to_dict())
+        except Exception as e:
+            logger.warning("Failed to save run record %s: %s", self.id, e)
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            sections = {
+                name: {k: v for k, v in info.items() if not k.startswith("_")}
+                for name, info in self.sections.items()
+            }
+            return {
+                "run_id": self.id,
+                "date": str(self.date),
+                "status": self.status,
+                "targets": list(self.targets),
+                "errors": list(self.errors),
+                "created_at": self.created_at.isoformat(),
+                "started_at": self.started_at.isoformat() if self.started_at else None,
+                "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+                "sections": sections,
+                "spans": summarize_trace(list(self.spans)),
+            }
+
+
+_runs = OrderedDict()  # run_id -> BriefingRun (최근 RUN_HISTORY_LIMIT개)
+_runs_lock = threading.Lock()
+_run_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="briefing")
+
+
+def register_run(run: BriefingRun) -> None:
+    with _runs_lock:
+        _runs[run.id] = run
+        while len(_runs) > RUN_HISTORY_LIMIT:
+            _runs.popitem(last=False)
+    run.save()
+
+
+def get_run(run_id: str) -> BriefingRun | None:
+    with _runs_lock:
+        return _runs.get(run_id)
+
+
+def _deliver_sections(run: BriefingRun, sub: Subscription, pending: list[tuple[str, dict]]) -> None:
+    """준비된 섹션 embed를 한 번에 전송하고, 섹션별 완료 여부를 저장소에 기록한다."""
+    if not pending:
+        return
+    failed = send_to_discord([embed for _, embed in pending], sub.sender)
+    failed_ids = {id(embed) for embed in failed}
+    for section, embed in pending:
+        status = "failed" if id(embed) in failed_ids else "done"
+        run_state.mark_section(run.date, sub.state_key(section), status)
+        if status == "failed":
+            run.errors.append(f"discord: {sub.state_key(section)} send failed")
+
+
+def _stream_section(run: BriefingRun, sub: Subscription, section: str, label: str, graph, buffer) -> None:
+    """첫 조각으로 메시지를 올린 뒤, 생성이 끝날 때까지 일정 간격으로 제자리 수정한다.
+
+    생성이 중간에 실패하면 받은 데까지의 내용으로 커서(▌)만 지워 둔다.
+    """
+    key = sub.state_key(section)
+    node = sub.node(section)
+    version, embed = buffer.partial_embed()
+    message_id = sub.sender.post_message([embed])
+
+    while message_id and not buffer.wait_closed(STREAM_EDIT_INTERVAL) and not graph.done(node):
+        latest, embed = buffer.partial_embed()
+        if latest != version:
+            version = latest
+            sub.sender.edit_message(message_id, [embed])
+
     try:
-        today_info = build_today_info_embed()
-        send_to_discord([today_info])
+        final = graph.result(node)
     except Exception as e:
-        logger.error("Today info error: %s", e)
-        errors.append(f"today_info: {e}")
+        logger.error("Section %s error: %s", section, e)
+        if message_id:
+            sub.sender.edit_message(message_id, [buffer.last_embed()])
+        run_state.mark_section(run.date, key, "failed")
+        if f"{label}: {e}" not in run.errors:
+            run.errors.append(f"{label}: {e}")
+        return
+
+    if message_id is None:
+        _deliver_sections(run, sub, [(section, final)] if final else [])
+        return
+    if final and not sub.sender.edit_message(message_id, [final]):
+        run_state.mark_section(run.date, key, "failed")
+        run.errors.append(f"discord: {key} send failed")
+        return
+    run_state.mark_section(run.date, key, "done")
+
+
+def _deliver_subscription(
+    run: BriefingRun, graph, sub: Subscription, items: list[tuple[str, str]]
+) -> None:
+    """구독 1개에 섹션을 정해진 순서로 전송한다. 이미 완료된 연속 섹션은 한 메시지로 묶는다."""
+    errors = run.errors
+    pending = []
+    for i, (section, label) in enumerate(items):
+        node = sub.node(section)
+        buffer = graph.streams.get(node)
+        if buffer is not None:
+            # 노드가 버퍼를 닫지 못하고 끝나도 멈추지 않도록 노드 종료도 함께 확인
+            while not buffer.wait_for_text(STREAM_EDIT_INTERVAL) and not graph.done(node):
+                pass
+            if buffer.text and not buffer.closed:
+                # 스트리밍 중: 앞선 섹션을 먼저 보내 순서를 지킨 뒤 점진적으로 전송
+                if pending:
+                    _deliver_sections(run, sub, pending)
+                    pending = []
+                _stream_section(run, sub, section, label, graph, buffer)
+                continue
+        try:
+            embed = graph.result(node)
+            if embed:
+                pending.append((section, embed))
+            else:
+                run_state.mark_section(run.date, sub.state_key(section), "done")  # 보낼 내용 없음
+        except Exception as e:
+            logger.error("Section %s error: %s", section, e)
+            run_state.mark_section(run.date, sub.state_key(section), "failed")
+            if f"{label}: {e}" not in errors:
+                errors.append(f"{label}: {e}")
+
+        next_ready = i + 1 < len(items) and graph.done(sub.node(items[i + 1][0]))
+        if pending and not next_ready:
+            _deliver_sections(run, sub, pending)
+            pending = []
+
+
+def run_briefing(run: BriefingRun) -> BriefingRun:
+    """대상 섹션을 병렬로 실행하고, 끝나는 대로 구독별로 정해진 순서에 맞춰 전송한다.
+
+    같은 입력의 섹션(뉴스 요약, 도시별 날씨 등)은 구독 수와 관계없이 한 번만 생성하고,
+    구독(웹훅)마다 별도 스레드에서 동시에 전송한다.
+    호출 전에 `run_state`의 임대를 잡아 두어야 하며, 끝나면 여기서 해제한다.
+    """
+    run.started_at = datetime.now(TZ)
+    run.status = "running"
+    run.save()
+    errors = run.errors
+    trace_token = _current_trace.set(run.spans)
+    deadline_token = _run_deadline.set(time.monotonic() + RUN_DEADLINE)
 
-    # ── 3. 날씨 ──
     try:
-        wdata = fetch_weather()
-        wembed = build_weather_embed(wdata)
-        send_to_discord([wembed])
+        plan = delivery_plan(run.targets)
+        cities = {sub.city for sub, items in plan if any(s == "weather" for s, _ in items)}
+        graph = build_section_graph(
+            listener=run.update_section, stream=run.stream, cities=sorted(cities)
+        )
+        graph.start({sub.node(section) for sub, items in plan for section, _ in items})
+
+        if len(plan) == 1:
+            _deliver_subscription(run, graph, *plan[0])
+        elif plan:
+            with ThreadPoolExecutor(max_workers=len(plan), thread_name_prefix="deliver") as pool:
+                futures = [
+                    submit_in_context(pool, _deliver_subscription, run, graph, sub, items)
+                    for sub, items in plan
+                ]
+            for future in futures:
+                future.result()
+
+        if feed_store is not None:
+            states = run_state.section_states(run.date)
+            delivered = {
+                section for sub, items in plan for section, _ in items
+                if states.get(sub.state_key(section)) == "done"
+            }
+            for section, name in BRIEFING_MARKS.items():
+                if section in delivered:
+                    feed_store.mark_briefing(name, run.started_at)
     except Exception as e:
-        logger.error("Weather error: %s", e)
-        errors.append(f"weather: {e}")
+        logger.exception("Briefing run %s failed", run.id)
+        errors.append(f"run: {e}")
+    finally:
+        run_state.release_lease(run.date, run.id)
+
+    logger.info("Gemini cache stats: %s", gemini_cache.stats())
+    run.status = "ok" if not errors else "partial"
+    run.finished_at = datetime.now(TZ)
+    run.save()
+    _current_trace.reset(trace_token)
+    _run_deadline.reset(deadline_token)
+
+    duration = (run.finished_at - run.started_at).total_seconds()
+    metrics.inc("ai_secretary_runs_total", 1, "Briefing runs by final status", status=run.status)
+    metrics.observe("ai_secretary_run_duration_seconds", duration, SPAN_DURATION_BUCKETS,
+                    "End-to-end briefing run duration")
+    summary = run.to_dict()
+    logger.info("Run timings: %s", json.dumps({
+        "run_id": run.id,
+        "status": run.status,
+        "total_ms": round(duration * 1000, 1),
+        "sections": {k: v.get("duration_ms") for k, v in summary["sections"].items()},
+        "spans": summary["spans"],
+    }, ensure_ascii=False))
+    return run
+
+
+# ═════════════════════════════════════════════════════════════════════════
+#  10) 아카이브 & 기간 리포트
+# ═════════════════════════════════════════════════════════════════════════
 
-    # ── 4. 일반 뉴스 ──
+class BriefingArchive:
+    """날짜별로 수집한 엔트리와 섹션 요약을 보관하는 SQLite 아카이브.
+
+    엔트리는 제목·링크·출처만 (본문 없이) 링크 해시로 중복 없이 저장하고, 요약은
+    (날짜, 섹션)마다 마지막 결과를 남긴다. 기간 리포트용 일별 노트도 여기에 두어
+    지난 날짜는 한 번만 생성한다 (그날 요약이 바뀌면 노트를 지워 다시 만든다).
+    """
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._db = LazySqlite(
+            path,
+            "CREATE TABLE IF NOT EXISTS archive_entries ("
+            " date TEXT NOT NULL, section TEXT NOT NULL, url_hash TEXT NOT NULL,"
+            " source TEXT NOT NULL, title TEXT NOT NULL, link TEXT NOT NULL,"
+            " published_at REAL NOT NULL, PRIMARY KEY (date, section, url_hash));"
+            "CREATE TABLE IF NOT EXISTS archive_summaries ("
+            " date TEXT NOT NULL, section TEXT NOT NULL, text TEXT NOT NULL,"
+            " created_at REAL NOT NULL, PRIMARY KEY (date, section));"
+            "CREATE TABLE IF NOT EXISTS archive_notes ("
+            " date TEXT PRIMARY KEY, text TEXT NOT NULL, created_at REAL NOT NULL);",
+        )
+
+    def put_entries(self, date, section: str, entries: list[FeedEntry]) -> None:
+        with self._lock:
+            conn = self._db.conn
+            conn.executemany(
+                "INSERT OR IGNORE INTO archive_entries"
+                " (date, section, url_hash, source, title, link, published_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (str(date), section, url_hash(e.link), ", ".join(e.sources) or e.source,
+                     e.title, e.link, e.published.timestamp())
+                    for e in entries
+                ],
+            )
+            cutoff = str(date - timedelta(days=ARCHIVE_RETENTION_DAYS))
+            for table in ("archive_entries", "archive_summaries", "archive_notes"):
+                conn.execute(f"DELETE FROM {table} WHERE date < ?", (cutoff,))
+            conn.commit()
+
+    def put_summary(self, date, section: str, text: str) -> None:
+        with self._lock:
+            self._db.conn.execute(
+                "INSERT OR REPLACE INTO archive_summaries (date, section, text, created_at)"
+                " VALUES (?, ?, ?, ?)",
+                (str(date), section, text, time.time()),
+            )
+            self._db.conn.execute("DELETE FROM archive_notes WHERE date = ?", (str(date),))
+            self._db.conn.commit()
+
+    def summaries(self, start, end) -> dict[str, dict[str, str]]:
+        """{날짜: {섹션: 요약}} (`start` ~ `end` 포함, 날짜순)."""
+        with self._lock:
+            rows = self._db.conn.execute(
+                "SELECT date, section, text FROM archive_summaries"
+                " WHERE date BETWEEN ? AND ? ORDER BY date",
+                (str(start), str(end)),
+            ).fetchall()
+        result = {}
+        for date, section, text in rows:
+            result.setdefault(date, {})[section] = text
+        return result
+
+    def entry_counts(self, start, end) -> dict[str, int]:
+        with self._lock:
+            rows = self._db.conn.execute(
+                "SELECT section, COUNT(*) FROM archive_entries"
+                " WHERE date BETWEEN ? AND ? GROUP BY section",
+                (str(start), str(end)),
+            ).fetchall()
+        return dict(rows)
+
+    def get_note(self, date) -> str | None:
+        with self._lock:
+            row = self._db.conn.execute(
+                "SELECT text FROM archive_notes WHERE date = ?", (str(date),)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put_note(self, date, text: str) -> None:
+        with self._lock:
+            self._db.conn.execute(
+                "INSERT OR REPLACE INTO archive_notes (date, text, created_at) VALUES (?, ?, ?)",
+                (str(date), text, time.time()),
+            )
+            self._db.conn.commit()
+
+
+archive = BriefingArchive(ARCHIVE_PATH) if ARCHIVE_PATH else None
+
+
+def archive_entries(section: str, entries: list[FeedEntry]) -> None:
+    """수집한 엔트리를 오늘 날짜로 보관 (아카이브가 없거나 실패해도 브리핑은 계속)."""
+    if archive is None or not entries:
+        return
     try:
-        entries = fetch_rss_entries(NEWS_RSS_URLS)
-        summary = summarize_news(entries)
-        send_to_discord([build_news_embed(summary)])
-        logger.info("News entries collected: %d", len(entries))
+        archive.put_entries(datetime.now(TZ).date(), section, entries)
     except Exception as e:
-        logger.error("News error: %s", e)
-        errors.append(f"news: {e}")
+        logger.warning("Archive write failed (%s entries): %s", section, e)
+
+
+def archive_summary(section: str, text: str, fallback: str | None = None) -> str:
+    """섹션 요약을 오늘 날짜로 보관하고 그대로 돌려준다 (오류 안내 문구는 보관하지 않음)."""
+    if archive is not None and text and text != fallback:
+        try:
+            archive.put_summary(datetime.now(TZ).date(), section, text)
+        except Exception as e:
+            logger.warning("Archive write failed (%s summary): %s", section, e)
+    return text
 
-    # ── 5. 게임 뉴스 ──
+
+DIGEST_PERIODS = {"week": 7, "month": 30}
+DIGEST_NOTE_LINES = 8
+ARCHIVE_SECTION_LABELS = {"news": "세계 뉴스", "gaming_news": "게임 뉴스", "gaming_trends": "게임 트렌드"}
+
+DAILY_NOTE_INSTRUCTIONS = f"""아래는 하루치 뉴스·게임 브리핑입니다. 기간 리포트에 쓸 수 있도록 그날의 핵심만 남겨주세요.
+
+규칙:
+- 형식: - [분류] 핵심 내용 한 문장 (분류: 세계, 게임, 트렌드)
+- 회사, 게임 타이틀, 수치 등 구체적 정보는 유지
+- 최대 {DIGEST_NOTE_LINES}줄"""
+
+
+def daily_note(date, summaries: dict[str, str]) -> tuple[str, bool]:
+    """하루치 요약을 짧은 노트로 압축한다. (노트, 새로 생성했는지).
+
+    저장된 노트가 있으면 그대로 쓰고, 생성에 실패하면 원본 요약 앞부분으로 대신한다
+    (실패한 노트는 저장하지 않아 다음 리포트에서 다시 시도).
+    """
+    note = archive.get_note(date)
+    if note:
+        return note, False
+
+    body = "\n\n".join(
+        f"[{ARCHIVE_SECTION_LABELS.get(section, section)}]\n{text}"
+        for section, text in summaries.items()
+    )
     try:
-        gaming_entries = fetch_rss_entries(GAMING_RSS_URLS)
-        logger.info("Gaming entries collected: %d", len(gaming_entries))
-        if gaming_entries:
-            gaming_summary = summarize_gaming_news(gaming_entries)
-            send_to_discord([build_gaming_news_embed(gaming_summary)])
-
-            trends = analyze_gaming_trends(gaming_entries)
-            send_to_discord([build_gaming_trends_embed(trends)])
+        note = gemini_generate(f"{DAILY_NOTE_INSTRUCTIONS}\n\n{body}").strip()
     except Exception as e:
-        logger.error("Gaming news error: %s", e)
-        errors.append(f"gaming: {e}")
+        logger.warning("Daily note for %s failed, using raw summaries: %s", date, e)
+        return truncate_for_discord(body, 800), False
+    archive.put_note(date, note)
+    return note, True
+
 
-    status = "ok" if not errors else "partial"
-    return jsonify(status=status, errors=errors, date=str(today)), 200
+def digest_prompt(period: str, notes: dict[str, str]) -> str:
+    label = "주간" if period == "week" else "월간"
+    days = "\n\n".join(f"### {date}\n{note}" for date, note in notes.items())
+    return f"""아래는 날짜별 브리핑 노트입니다. 이를 바탕으로 {label} 리포트를 다음 형식으로 작성해주세요:
+
+## 🗞️ 주요 흐름
+- 기간 동안 이어진 세계 뉴스 흐름 3~5개
+
+## 🎮 게임 업계 트렌드
+- 반복해서 등장한 회사·장르·이슈와 그 변화
+
+## 🔭 다음에 주목할 점
+- 2~3개
+
+전체 내용이 1800자를 넘기지 않도록 해주세요.
+
+{days}"""
+
+
+def build_digest(period: str, end=None) -> dict:
+    """보관된 일별 요약으로 기간 리포트를 만든다 (원본 엔트리는 다시 읽지 않음).
+
+    날짜마다 노트를 한 번 만들어 보관하므로, 이후 리포트는 새 날짜의 노트와
+    최종 프롬프트 1회만 호출한다.
+    """
+    end = end or datetime.now(TZ).date()
+    start = end - timedelta(days=DIGEST_PERIODS[period] - 1)
+    summaries = archive.summaries(start, end)
+    result = {
+        "period": period,
+        "start": str(start),
+        "end": str(end),
+        "days": len(summaries),
+        "entries": archive.entry_counts(start, end),
+    }
+    if not summaries:
+        return {**result, "generated_notes": 0, "report": None}
+
+    with trace_span("digest", period, chunks=len(summaries)):
+        executor = ThreadPoolExecutor(max_workers=max(1, MAP_WORKERS), thread_name_prefix="digest")
+        futures = {
+            date: submit_in_context(executor, daily_note, date, day)
+            for date, day in summaries.items()
+        }
+        executor.shutdown(wait=False)
+        notes = {date: future.result() for date, future in futures.items()}
+        generated = sum(1 for _, new in notes.values() if new)
+        try:
+            report = gemini_generate(
+                digest_prompt(period, {date: note for date, (note, _) in notes.items()}),
+                GEMINI_CACHE_TTLS["digest"],
+            )
+        except Exception as e:
+            # 일별 노트는 이미 저장됐으므로 다음 요청은 최종 프롬프트만 다시 시도한다
+            logger.error("Digest report generation failed: %s", e)
+            return {**result, "generated_notes": generated, "report": None, "error": str(e)}
+
+    logger.info("Digest %s %s~%s: %d days, %d new notes", period, start, end, len(notes), generated)
+    return {**result, "generated_notes": generated, "report": report}
+
+
+def build_digest_embed(digest: dict) -> dict:
+    label = "📅 주간 리포트" if digest["period"] == "week" else "🗓️ 월간 리포트"
+    return {
+        "title": f"{label} ({digest['start']} ~ {digest['end']})",
+        "description": truncate_for_discord(digest["report"]),
+        "color": 0xE67E22,
+        "footer": {"text": f"Powered by Google Gemini · {digest['days']}일치 브리핑 기준"},
+    }
+
+
+# ═════════════════════════════════════════════════════════════════════════
+#  라우트
+# ═════════════════════════════════════════════════════════════════════════
+
+def require_auth(view):
+    """`AUTH_TOKEN`이 설정돼 있으면 `?token=`이 일치하는 요청만 통과시킨다."""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        if AUTH_TOKEN and request.args.get("token") != AUTH_TOKEN:
+            logger.warning("Unauthorized access attempt from %s", request.remote_addr)
+            return jsonify(error="unauthorized"), 401
+        return view(*args, **kwargs)
+
+    return wrapper
+
+
+@app.route("/health", methods=["GET"])
+def health():
+    """헬스체크 엔드포인트 (Cloud Run / 로드밸런서용). 외부 대상별 서킷 상태를 함께 보여준다."""
+    breakers = breaker_states()
+    return jsonify(
+        status="healthy",
+        timestamp=datetime.now(TZ).isoformat(),
+        startup_ms=round(STARTUP_MS, 1),
+        open_circuits=sorted(t for t, b in breakers.items() if b["state"] != "closed"),
+        breakers=breakers,
+    ), 200
+
+
+@app.route("/metrics", methods=["GET"])
+def metrics_endpoint():
+    """Prometheus 형식 메트릭 (스팬별 소요 시간 히스토그램, 전송 바이트 등)."""
+    return metrics.render(), 200, {"Content-Type": "text/plain; version=0.0.4; charset=utf-8"}
+
+
+@app.route("/", methods=["GET"])
+@require_auth
+def handler():
+    # ── 같은 날 중복 실행 방지: 완료된 섹션은 건너뛰고 빠진/실패한 섹션만 실행 ──
+    today = datetime.now(TZ).date()
+    force = request.args.get("force", "").lower()
+    targets = sections_to_run(today, force)
+    if not targets:
+        logger.info("Already ran today (%s). Skipping. Use ?force=true to override.", today)
+        return jsonify(status="already_ran", date=str(today)), 200
+
+    stream = request.args.get("stream", str(GEMINI_STREAM)).lower() == "true"
+    run = BriefingRun(today, targets, stream)
+    if not run_state.acquire_lease(today, run.id):
+        logger.info("Another instance is running today's briefing (%s). Skipping.", today)
+        return jsonify(status="in_progress", date=str(today)), 409
+
+    # 임대를 잡기 직전에 다른 실행이 끝났을 수 있으므로 완료 상태를 다시 읽는다
+    run.targets = targets = sections_to_run(today, force)
+    if not targets:
+        run_state.release_lease(today, run.id)
+        logger.info("Already ran today (%s). Skipping. Use ?force=true to override.", today)
+        return jsonify(status="already_ran", date=str(today)), 200
+    register_run(run)
+    logger.info("Briefing run %s (%s) sections: %s", run.id, INSTANCE_ID, ", ".join(targets))
+
+    # ── 비동기 모드: 백그라운드 워커에 맡기고 바로 202 반환 ──
+    run_async = request.args.get("async", str(ASYNC_RUNS)).lower() == "true"
+    if run_async:
+        _run_executor.submit(run_briefing, run)
+        logger.info("Briefing run %s queued", run.id)
+        return jsonify(
+            status="accepted", run_id=run.id, status_url=f"/runs/{run.id}", date=str(today)
+        ), 202
+
+    run_briefing(run)
+    return jsonify(status=run.status, errors=run.errors, date=str(today), run_id=run.id), 200
+
+
+@app.route("/runs/<run_id>", methods=["GET"])
+@require_auth
+def run_status(run_id: str):
+    """비동기 실행의 진행 상황, 섹션별 소요 시간, 최종 errors 조회.
+
+    다른 워커/인스턴스가 실행한 기록은 실행 상태 저장소(`RUN_STATE_PATH`)에서 읽는다.
+    """
+    run = get_run(run_id)
+    record = run.to_dict() if run is not None else run_state.load_run(run_id)
+    if record is None:
+        return jsonify(error="not_found", run_id=run_id), 404
+    return jsonify(record), 200
+
+
+@app.route("/precompute", methods=["GET", "POST"])
+@require_auth
+def precompute():
+    """인사/오늘의 일정 embed를 미리 생성 (밤사이 스케줄러로 호출, 기본: 내일 날짜).
+
+    `?date=YYYY-MM-DD`로 날짜를 지정할 수 있다.
+    """
+    day = None
+    if request.args.get("date"):
+        try:
+            day = datetime.strptime(request.args["date"], "%Y-%m-%d").date()
+        except ValueError:
+            return jsonify(error="invalid_date", date=request.args["date"]), 400
+
+    result = precompute_daily_sections(day)
+    failed = any(v != "stored" for v in result["sections"].values())
+    return jsonify(status="partial" if failed else "ok", **result), 200
+
+
+@app.route("/digest", methods=["GET", "POST"])
+@require_auth
+def digest():
+    """보관된 일별 요약으로 기간 리포트 생성 (`?period=week|month`, 기본: week).
+
+    `?end=YYYY-MM-DD`로 마지막 날짜(기본: 오늘)를, `?send=true`로 모든 구독의 웹훅에
+    전송을 지정한다 (`?subscription=<name>`이면 그 구독에만).
+    """
+    if archive is None:
+        return jsonify(error="archive_disabled"), 404
+
+    period = request.args.get("period", "week").lower()
+    if period not in DIGEST_PERIODS:
+        return jsonify(error="invalid_period", period=period), 400
+    end = None
+    if request.args.get("end"):
+        try:
+            end = datetime.strptime(request.args["end"], "%Y-%m-%d").date()
+        except ValueError:
+            return jsonify(error="invalid_date", date=request.args["end"]), 400
+
+    targets = subscriptions
+    if request.args.get("subscription"):
+        targets = [sub for sub in subscriptions if sub.name == request.args["subscription"]]
+        if not targets:
+            return jsonify(error="unknown_subscription", subscription=request.args["subscription"]), 400
+
+    result = build_digest(period, end)
+    if "error" in result:
+        return jsonify(status="failed", **result), 502
+    if result["report"] is None:
+        return jsonify(status="empty", **result), 200
+
+    status = "ok"
+    if request.args.get("send", "false").lower() == "true":
+        embed = build_digest_embed(result)
+        failed = [sub.name for sub in targets if send_to_discord([embed], sub.sender)]
+        result["sent_to"] = [sub.name for sub in targets if sub.name not in failed]
+        if failed:
+            status = "send_failed"
+            result["send_failed"] = failed
+    return jsonify(status=status, **result), 200
+
+
+# ─── 백그라운드 작업 ────────────────────────────────────────────────────
+def start_background_tasks() -> None:
+    """서버 프로세스(워커)가 뜬 뒤 호출: 클라이언트 예열과 피드 수집기를 시작한다."""
+    if PRELOAD_CLIENTS:
+        threading.Thread(target=warm_up_clients, name="warm-up", daemon=True).start()
+    if feed_store is not None and FEED_INGEST_INTERVAL > 0:
+        threading.Thread(target=_feed_ingestion_loop, name="feed-ingest", daemon=True).start()
+        logger.info("Feed ingestion every %ds into %s", FEED_INGEST_INTERVAL, FEED_STORE_PATH)
+
+
+# ─── 콜드 스타트 시간 측정 ───────────────────────────────────────────────
+STARTUP_MS = (time.perf_counter() - _STARTUP_BEGAN) * 1000
+if STARTUP_MS > STARTUP_BUDGET_MS:
+    logger.warning("Startup took %.0f ms (budget %.0f ms)", STARTUP_MS, STARTUP_BUDGET_MS)
+else:
+    logger.info("Startup completed in %.0f ms (budget %.0f ms)", STARTUP_MS, STARTUP_BUDGET_MS)
 
 
 if __name__ == "__main__":
+    # `python main.py precompute [YYYY-MM-DD]` — 날짜 전용 섹션만 미리 생성하고 종료
+    if len(sys.argv) > 1 and sys.argv[1] == "precompute":
+        day = datetime.strptime(sys.argv[2], "%Y-%m-%d").date() if len(sys.argv) > 2 else None
+        result = precompute_daily_sections(day)
+        print(json.dumps(result, ensure_ascii=False))
+        sys.exit(0 if all(v == "stored" for v in result["sections"].values()) else 1)
+
+    # `python main.py digest [week|month]` — 기간 리포트를 만들어 출력하고 종료
+    if len(sys.argv) > 1 and sys.argv[1] == "digest":
+        if archive is None:
+            logger.critical("ARCHIVE_PATH is not set")
+            sys.exit(1)
+        period = sys.argv[2] if len(sys.argv) > 2 else "week"
+        if period not in DIGEST_PERIODS:
+            logger.critical("Unknown digest period: %s", period)
+            sys.exit(1)
+        result = build_digest(period)
+        print(json.dumps(result, ensure_ascii=False))
+        sys.exit(1 if "error" in result else 0)
+
+    # 로컬 개발용. 프로덕션은 gunicorn(gunicorn.conf.py)으로 실행한다.
     port = int(os.environ.get("PORT", 8080))
-    logger.info("Starting AI Secretary on port %d", port)
-    app.run(host="0.0.0.0", port=port)
+    start_background_tasks()
+    logger.info("Starting AI Secretary (dev server) on port %d", port)
+    app.run(host="0.0.0.0", port=port, threaded=True)
@@ -0,0 +1,49 @@
+# tests/test_outbound.py — call_outbound()와 서킷 브레이커 회귀 테스트
+import os
+import unittest
+from unittest import mock
+
+for _name in ("OPENWEATHER_API_KEY", "GEMINI_API_KEY", "DISCORD_WEBHOOK_URL"):
+    os.environ.setdefault(_name, "test")
+
+import main  # noqa: E402
+
+
+class HalfOpenRetryTest(unittest.TestCase):
+    def setUp(self):
+        main._breakers.clear()
+        self.breaker = main.get_breaker("test")
+        self.breaker.cooldown = 0
+        for _ in range(self.breaker.failures):
+            self.breaker.record_failure(ConnectionError("down"))
+        self.assertEqual(self.breaker.snapshot()["state"], "open")
+
+    def test_probe_retries_after_transient_error(self):
+        calls = []
+
+        def flaky(timeout):
+            calls.append(timeout)
+            if len(calls) == 1:
+                raise ConnectionError("reset")
+            return "ok"
+
+        with mock.patch.object(main.time, "sleep"):
+            self.assertEqual(main.call_outbound("test", flaky, timeout=1, retries=2), "ok")
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(self.breaker.snapshot()["state"], "closed")
+
+    def test_failed_probe_reopens_instead_of_sticking(self):
+        def down(timeout):
+            raise ConnectionError("reset")
+
+        with mock.patch.object(main.time, "sleep"):
+            with self.assertRaises(ConnectionError):
+                main.call_outbound("test", down, timeout=1, retries=2)
+        self.assertEqual(self.breaker.snapshot()["state"], "open")
+        # 쿨다운(0초)이 지나면 다시 시험 호출이 허용되어야 한다
+        self.assertEqual(main.call_outbound("test", lambda timeout: "ok", timeout=1), "ok")
+        self.assertEqual(self.breaker.snapshot()["state"], "closed")
+
+
+if __name__ == "__main__":
+    unittest.main()